@@ -10,35 +10,56 @@ Version: 3.0.28
 """
 
 import json
+import mmap
 import os
 import sys
 import re
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Version information
 SCRIPT_VERSION = "3.0.28"
 SCRIPT_DATE = "2025-08-17"
 
 # Color codes for cross-platform support
-class Colors:
-    if os.name == 'nt':  # Windows
-        # Windows color codes
-        RESET = ''
-        CYAN = ''
-        GREEN = ''
-        YELLOW = ''
-        RED = ''
-        BLUE = ''
-        MAGENTA = ''
-    else:  # Unix/Linux/Mac
-        RESET = '\033[0m'
-        CYAN = '\033[96m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        BLUE = '\033[94m'
-        MAGENTA = '\033[95m'
+if os.name == 'nt':  # Windows
+    RESET = CYAN = GREEN = YELLOW = RED = BLUE = MAGENTA = ''
+else:  # Unix/Linux/Mac
+    RESET = '\033[0m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    MAGENTA = '\033[95m'
+
+# Files larger than this are memory-mapped instead of read into the heap
+MMAP_THRESHOLD = 65536
+
+# Version strings live in file headers, so this prefix is searched first
+SCAN_WINDOW = 65536
+
+# Chunked fallback scan: read size, and bytes carried over between chunks
+# (longer than any version pattern, so matches across a boundary are kept)
+STREAM_CHUNK = 65536
+STREAM_OVERLAP = 4096
+
+# Raw file contents keyed by path, so each file is read from disk only once
+_FILE_CACHE: dict[str, bytes] = {}
+
+# Check results keyed by (path, mtime_ns, size, version, search_pattern);
+# only this run's entries are saved, so stale keys drop out of the cache
+RESULT_CACHE_FILE = ".version_check_cache.json"
+_PREVIOUS_RESULTS: dict[tuple, tuple] = {}
+_RESULT_CACHE: dict[tuple, tuple] = {}
 
 def print_header():
     """Print the header banner"""
@@ -49,6 +70,25 @@ def print_header():
     print("================================================================")
     print()
 
+def load_result_cache():
+    """Load cached check results from the previous run, if any"""
+    try:
+        # Plain JSON data: [[key fields...], [result fields...]] pairs
+        entries = json.loads(Path(RESULT_CACHE_FILE).read_bytes())
+        _PREVIOUS_RESULTS.update((tuple(key), tuple(result)) for key, result in entries)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # A stale or corrupt cache only costs a full rescan
+        _PREVIOUS_RESULTS.clear()
+
+def save_result_cache():
+    """Persist check results so unchanged files are skipped next run"""
+    try:
+        Path(RESULT_CACHE_FILE).write_text(json.dumps(list(_RESULT_CACHE.items())), encoding='utf-8')
+    except OSError:
+        pass
+
 def load_config():
     """Load the version configuration from JSON"""
     config_file = "version_config.json"
@@ -59,154 +99,262 @@ def load_config():
     
     try:
         if not os.path.exists(config_file):
-            print(f"{Colors.RED}[ERROR] Configuration file not found: {config_file}{Colors.RESET}")
+            print(f"{RED}[ERROR] Configuration file not found: {config_file}{RESET}")
             return None
             
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        data = Path(config_file).read_bytes()
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
             
-        print(f"{Colors.GREEN}[OK] Configuration file found: {config_file}{Colors.RESET}")
+        print(f"{GREEN}[OK] Configuration file found: {config_file}{RESET}")
         print()
         
         return config
         
     except json.JSONDecodeError as e:
-        print(f"{Colors.RED}[ERROR] Invalid JSON in {config_file}: {e}{Colors.RESET}")
+        print(f"{RED}[ERROR] Invalid JSON in {config_file}: {e}{RESET}")
         return None
     except Exception as e:
-        print(f"{Colors.RED}[ERROR] Failed to load {config_file}: {e}{Colors.RESET}")
+        print(f"{RED}[ERROR] Failed to load {config_file}: {e}{RESET}")
         return None
 
-def check_file_version(filepath, expected_version, search_pattern, description=""):
+# Default search patterns per file type, filled in with the expected version
+_DEFAULT_PATTERNS = {
+    '.bat': (
+        b'SCRIPT_VERSION=%s',
+        b'SCRIPT_VERSION="%s"',
+        b'v%s'
+    ),
+    '.py': (
+        b'SCRIPT_VERSION = "%s"',
+        b'AI Environment Module v%s',
+        b'Version: %s',
+        b'Version %s'
+    ),
+}
+_FALLBACK_PATTERNS = (
+    b'v%s',
+    b'Version %s',
+    b'%s'
+)
+
+def _search(pattern, buf):
+    """Search the header window first and fall back to the whole buffer on a miss"""
+    if pattern.search(buf, 0, SCAN_WINDOW) is not None:
+        return True
+    return len(buf) > SCAN_WINDOW and pattern.search(buf) is not None
+
+@functools.lru_cache(maxsize=1024)
+def _ext(path):
+    """Return the lowercased extension of a path"""
+    return os.path.splitext(path)[1].lower()
+
+@functools.cache
+def _pattern(file_ext, expected_version, custom):
+    """Compile the search regex for a file type and version, once per run"""
+    if custom:
+        return re.compile(re.escape(custom.encode('utf-8')))
+    version = expected_version.encode('utf-8')
+    templates = _DEFAULT_PATTERNS.get(file_ext, _FALLBACK_PATTERNS)
+    return re.compile(b'|'.join(re.escape(t % version) for t in templates))
+
+def _stream_search(f, pattern):
+    """Scan an open file chunk by chunk, keeping memory bounded per file"""
+    tail = b''
+    while True:
+        chunk = f.read(STREAM_CHUNK)
+        if not chunk:
+            return False
+        window = tail + chunk
+        if _search(pattern, window):
+            return True
+        tail = window[-STREAM_OVERLAP:]
+
+def scan_present_files(filepaths):
+    """Map the configured files' directory entries by path, reading each parent directory once"""
+    present = {}
+    for directory in {os.path.dirname(path) for path in filepaths}:
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    present[os.path.normpath(os.path.join(directory, entry.name))] = entry
+        except OSError:
+            continue
+    return present
+
+def _scan_file(filepath, pattern):
+    """Search a file's contents for a pattern; open/read failures raise OSError"""
+    data = _FILE_CACHE.get(filepath)
+    if data is None:
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                # Let the kernel page in only what the scan touches
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    # Not mappable (special or network file): stream it instead
+                    return _stream_search(f, pattern)
+                with mm:
+                    return _search(pattern, mm)
+            data = f.read()
+        _FILE_CACHE[filepath] = data
+    return _search(pattern, data)
+
+def check_file_version(filepath, expected_version, search_pattern, description="", present=None):
     """Check if a file contains the expected version"""
+    # A directory entry from the scan is only a fast path (its stat is free on
+    # Windows); anything not listed, e.g. a name differing only in case on a
+    # case-insensitive volume, still gets a real stat before it is "missing"
+    entry = present.get(os.path.normpath(filepath)) if present else None
+    
     try:
-        if not os.path.exists(filepath):
-            return False, "FILE NOT FOUND", "missing"
-        
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # If there's a specific search pattern, use it
-        if search_pattern:
-            if search_pattern in content:
-                return True, f"Version {expected_version} found", "correct"
-            else:
-                return False, f"Version {expected_version} NOT found", "wrong"
-        else:
-            # Default search patterns based on file type
-            file_ext = os.path.splitext(filepath)[1].lower()
-            
-            if file_ext == '.bat':
-                patterns = [
-                    f'SCRIPT_VERSION={expected_version}',
-                    f'SCRIPT_VERSION="{expected_version}"',
-                    f'v{expected_version}'
-                ]
-            elif file_ext == '.py':
-                patterns = [
-                    f'SCRIPT_VERSION = "{expected_version}"',
-                    f'AI Environment Module v{expected_version}',
-                    f'Version: {expected_version}',
-                    f'Version {expected_version}'
-                ]
-            else:
-                patterns = [
-                    f'v{expected_version}',
-                    f'Version {expected_version}',
-                    expected_version
-                ]
-            
-            for pattern in patterns:
-                if pattern in content:
-                    return True, f"Version {expected_version} found", "correct"
-            
-            return False, f"Version {expected_version} NOT found", "wrong"
+        st = entry.stat() if entry is not None else os.stat(filepath)
+    except FileNotFoundError:
+        return False, "FILE NOT FOUND", "missing"
+    except OSError as e:
+        return False, f"ERROR: {e}", "error"
     
-    except Exception as e:
+    # Unchanged files keep the result from the previous run
+    key = (filepath, st.st_mtime_ns, st.st_size, expected_version, search_pattern)
+    result = _PREVIOUS_RESULTS.get(key)
+    if result is not None:
+        _RESULT_CACHE[key] = result
+        return result
+    
+    # A specific search pattern wins; otherwise use the file type defaults
+    if search_pattern:
+        pattern = _pattern('', '', search_pattern)
+    else:
+        pattern = _pattern(_ext(filepath), expected_version, '')
+    
+    try:
+        found = _scan_file(filepath, pattern)
+    except FileNotFoundError:
+        return False, "FILE NOT FOUND", "missing"
+    except OSError as e:
         return False, f"ERROR: {e}", "error"
+    
+    if found:
+        result = True, f"Version {expected_version} found", "correct"
+    else:
+        result = False, f"Version {expected_version} NOT found", "wrong"
+    
+    _RESULT_CACHE[key] = result
+    return result
+
+def _check_one(filename, expected_version, search_pattern, description, present=None):
+    """Check a single configured file without printing anything"""
+    success, message, status = check_file_version(filename, expected_version, search_pattern, description, present)
+    return filename, expected_version, success, message, status
+
+def _emit(out):
+    """Write buffered output lines: in one call when piped, line by line on a terminal"""
+    if sys.stdout.isatty():
+        for line in out:
+            sys.stdout.write(line)
+    else:
+        sys.stdout.write("".join(out))
+
+def _flatten_files(files_dict):
+    """Extract (filename, version, search_pattern, description) tuples from config entries"""
+    return [
+        (name, info['version'], info.get('search_pattern', ''), info.get('description', ''))
+        for name, info in files_dict.items()
+    ]
 
-def check_files_category(category_name, files_dict, stats):
+def check_files_category(category_name, files_list, stats, present=None):
     """Check a category of files (batch or python)"""
-    print("================================================================")
-    print(f"                       {category_name.upper()}")
-    print("================================================================")
-    print(f"[*] Checking {category_name.lower()} files from JSON configuration...")
-    print()
+    out = [
+        "================================================================\n",
+        f"                       {category_name.upper()}\n",
+        "================================================================\n",
+        f"[*] Checking {category_name.lower()} files from JSON configuration...\n",
+        "\n",
+    ]
     
-    for filename, info in files_dict.items():
-        stats['total'] += 1
-        expected_version = info['version']
-        search_pattern = info.get('search_pattern', '')
-        description = info.get('description', '')
-        
-        print(f"[*] Checking: {filename} (expected: {expected_version})")
-        
-        success, message, status = check_file_version(filename, expected_version, search_pattern, description)
+    # File reads and scans overlap in the pool; results come back in input order
+    with ThreadPoolExecutor(max_workers=min(32, len(files_list))) as executor:
+        results = list(executor.map(lambda entry: _check_one(*entry, present), files_list))
+    
+    for filename, expected_version, success, message, status in results:
+        out.append("".join(("[*] Checking: ", filename, " (expected: ", expected_version, ")\n")))
         
         if success:
-            print(f"{Colors.GREEN}[OK] {filename} - {message}{Colors.RESET}")
-            stats['correct'] += 1
+            out.append("".join((GREEN, "[OK] ", filename, " - ", message, RESET, "\n\n")))
+        elif status == "missing":
+            out.append("".join((RED, "[ERROR] ", filename, " - ", message, RESET, "\n\n")))
         else:
-            if status == "missing":
-                print(f"{Colors.RED}[ERROR] {filename} - {message}{Colors.RESET}")
-                stats['missing'] += 1
-            else:
-                print(f"{Colors.YELLOW}[WARNING] {filename} - {message}{Colors.RESET}")
-                stats['wrong'] += 1
-        print()
+            out.append("".join((YELLOW, "[WARNING] ", filename, " - ", message, RESET, "\n\n")))
+    
+    # Read errors are reported with the wrong-version files
+    counts = Counter(status for *_, status in results)
+    stats['total'] += len(results)
+    stats['correct'] += counts['correct']
+    stats['wrong'] += counts['wrong'] + counts['error']
+    stats['missing'] += counts['missing']
+    
+    _emit(out)
 
 def print_summary(stats):
     """Print the summary statistics"""
-    print("================================================================")
-    print("                       VERSION SUMMARY")
-    print("================================================================")
-    print()
-    print(f"Total files checked: {stats['total']}")
-    print(f"Files with correct version: {stats['correct']}")
-    print(f"Files with wrong version: {stats['wrong']}")
-    print(f"Files missing: {stats['missing']}")
-    print()
+    out = [
+        "================================================================\n",
+        "                       VERSION SUMMARY\n",
+        "================================================================\n",
+        "\n",
+        f"Total files checked: {stats['total']}\n",
+        f"Files with correct version: {stats['correct']}\n",
+        f"Files with wrong version: {stats['wrong']}\n",
+        f"Files missing: {stats['missing']}\n",
+        "\n",
+    ]
     
     if stats['correct'] == stats['total'] and stats['total'] > 0:
         percentage = 100.0
-        print(f"{Colors.GREEN}[SUCCESS] All files have correct versions ({percentage:.0f}%){Colors.RESET}")
-        print(f"{Colors.GREEN}[INFO] Your AI Environment system is up to date!{Colors.RESET}")
+        out.append(f"{GREEN}[SUCCESS] All files have correct versions ({percentage:.0f}%){RESET}\n")
+        out.append(f"{GREEN}[INFO] Your AI Environment system is up to date!{RESET}\n")
+        _emit(out)
         return True
     else:
         percentage = (stats['correct'] / stats['total']) * 100 if stats['total'] > 0 else 0
-        print(f"{Colors.YELLOW}[WARNING] Only {stats['correct']}/{stats['total']} files have correct versions ({percentage:.0f}%){Colors.RESET}")
-        print()
+        out.append(f"{YELLOW}[WARNING] Only {stats['correct']}/{stats['total']} files have correct versions ({percentage:.0f}%){RESET}\n")
+        out.append("\n")
         
         if stats['wrong'] > 0:
-            print(f"{Colors.YELLOW}[ACTION REQUIRED] {stats['wrong']} files have wrong versions{Colors.RESET}")
+            out.append(f"{YELLOW}[ACTION REQUIRED] {stats['wrong']} files have wrong versions{RESET}\n")
         if stats['missing'] > 0:
-            print(f"{Colors.RED}[ACTION REQUIRED] {stats['missing']} files are missing{Colors.RESET}")
+            out.append(f"{RED}[ACTION REQUIRED] {stats['missing']} files are missing{RESET}\n")
         
-        print(f"{Colors.CYAN}[SOLUTION] Check version_config.json for expected versions{Colors.RESET}")
-        print(f"{Colors.CYAN}[SOLUTION] Update files as needed or download latest package{Colors.RESET}")
+        out.append(f"{CYAN}[SOLUTION] Check version_config.json for expected versions{RESET}\n")
+        out.append(f"{CYAN}[SOLUTION] Update files as needed or download latest package{RESET}\n")
+        _emit(out)
         return False
 
 def print_footer(success):
     """Print the footer information"""
-    print()
-    print("================================================================")
-    print("                   JSON CONFIGURATION INFO")
-    print("================================================================")
-    print()
-    print(f"[INFO] Configuration file: version_config.json")
-    print(f"[INFO] Script version: {SCRIPT_VERSION}")
-    print(f"[INFO] To view detailed version requirements:")
+    out = [
+        "\n",
+        "================================================================\n",
+        "                   JSON CONFIGURATION INFO\n",
+        "================================================================\n",
+        "\n",
+        "[INFO] Configuration file: version_config.json\n",
+        f"[INFO] Script version: {SCRIPT_VERSION}\n",
+        "[INFO] To view detailed version requirements:\n",
+    ]
     if os.name == 'nt':  # Windows
-        print("  type version_config.json")
+        out.append("  type version_config.json\n")
     else:  # Unix/Linux/Mac
-        print("  cat version_config.json")
-    print()
-    print(f"[INFO] To update expected versions:")
-    print("  Edit version_config.json with your preferred text editor")
-    print()
-    print("================================================================")
-    print("                   VERSION CHECK COMPLETE")
-    print("================================================================")
+        out.append("  cat version_config.json\n")
+    out += [
+        "\n",
+        "[INFO] To update expected versions:\n",
+        "  Edit version_config.json with your preferred text editor\n",
+        "\n",
+        "================================================================\n",
+        "                   VERSION CHECK COMPLETE\n",
+        "================================================================\n",
+    ]
+    _emit(out)
 
 def main():
     """Main function"""
@@ -218,6 +366,7 @@ def main():
         sys.exit(1)
     
     expected_versions = config.get('expected_versions', {})
+    load_result_cache()
     
     # Initialize statistics
     stats = {
@@ -228,20 +377,24 @@ def main():
     }
     
     # Count total files
-    batch_files = expected_versions.get('batch_files', {})
-    python_files = expected_versions.get('python_files', {})
+    batch_files = _flatten_files(expected_versions.get('batch_files', {}))
+    python_files = _flatten_files(expected_versions.get('python_files', {}))
     total_expected = len(batch_files) + len(python_files)
     
     print(f"[INFO] Found configuration for {total_expected} files")
     print()
     
+    present = scan_present_files([entry[0] for entry in batch_files + python_files])
+    
     # Check batch files
     if batch_files:
-        check_files_category("BATCH FILES", batch_files, stats)
+        check_files_category("BATCH FILES", batch_files, stats, present)
     
     # Check Python files
     if python_files:
-        check_files_category("PYTHON FILES", python_files, stats)
+        check_files_category("PYTHON FILES", python_files, stats, present)
+    
+    save_result_cache()
     
     # Print summary
     success = print_summary(stats)
@@ -256,9 +409,9 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}[INFO] Version check interrupted by user{Colors.RESET}")
+        print(f"\n{YELLOW}[INFO] Version check interrupted by user{RESET}")
         sys.exit(1)
     except Exception as e:
-        print(f"\n{Colors.RED}[ERROR] Unexpected error: {e}{Colors.RESET}")
+        print(f"\n{RED}[ERROR] Unexpected error: {e}{RESET}")
         sys.exit(1)
 
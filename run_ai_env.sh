@@ -107,18 +107,27 @@ if [ "$VERBOSE_MODE" -eq 1 ]; then
     fi
 fi
 
-# Step 5: Launch the Python activation system using the configured Python
+# Step 5: Bake version constants when missing or older than version_config.json
+if [ ! -f "src/_version.py" ] || [ "version_config.json" -nt "src/_version.py" ]; then
+    if [ "$VERBOSE_MODE" -eq 1 ]; then
+        echo "[VERBOSE] Baking version constants into src/_version.py"
+    fi
+    "${AI_PYTHON_EXE}" tools/bake_version.py > /dev/null
+fi
+
+# Step 6: Launch the Python activation system using the configured Python
 echo "[INFO] Starting AI Environment Manager"
 echo ""
 
+# Tell the Python side the environment was already validated (this launch only)
 if [ "$VERBOSE_MODE" -eq 1 ]; then
     echo "[VERBOSE] Launching: ${AI_PYTHON_EXE} src/activate_ai_env.py --verbose"
-    "${AI_PYTHON_EXE}" src/activate_ai_env.py
+    AI_ENV_VALIDATED=1 "${AI_PYTHON_EXE}" src/activate_ai_env.py
 else
-    "${AI_PYTHON_EXE}" src/activate_ai_env.py
+    AI_ENV_VALIDATED=1 "${AI_PYTHON_EXE}" src/activate_ai_env.py
 fi
 
-# Step 6: Cleanup and exit
+# Step 7: Cleanup and exit
 echo ""
 echo "[INFO] AI Environment Manager closed"
 if [ "$VERBOSE_MODE" -eq 1 ]; then
@@ -8,40 +8,75 @@ Time: 10:30
 
 import sys
 import os
+import shutil
+import logging
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Prefer a C JSON parser for version_config.json when one is installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    try:
+        from ujson import loads as _loads
+    except ImportError:
+        from json import loads as _loads
+
+# Paths derived from this file, resolved once at import
+_MODULE_FILE = Path(__file__).resolve()
+_SRC_DIR = _MODULE_FILE.parent
+_ROOT = _SRC_DIR.parent
+_VERSION_CONFIG = _ROOT / "version_config.json"
+
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path, mtime, size):
+    """Parse version_config.json; cached per (path, mtime, size)"""
+    return _loads(config_path.read_bytes())
+
+def _iter_versions(config):
+    """Yield every version string listed in the configuration"""
+    # Metadata version
+    if 'metadata' in config and 'version' in config['metadata']:
+        yield config['metadata']['version']
+    
+    # All file versions
+    if 'expected_versions' in config:
+        for category in config['expected_versions'].values():
+            for file_info in category.values():
+                if 'version' in file_info:
+                    yield file_info['version']
+
+def _pack(version):
+    """Pack a major.minor.patch version string into one comparable integer"""
+    major, _, rest = version.partition('.')
+    minor, _, patch = rest.partition('.')
+    patch = patch.partition('.')[0]
+    return (int(major) << 64) | (int(minor or 0) << 32) | int(patch or 0)
+
+@functools.lru_cache(maxsize=4)
+def _compute_highest(config_path, mtime, size):
+    """Find the highest version listed in version_config.json, or None"""
+    config = _load_config(config_path, mtime, size)
+    
+    # Pack each version into an integer once and keep a running max
+    best = -1
+    best_str = None
+    for version in _iter_versions(config):
+        key = _pack(version)
+        if key > best:
+            best, best_str = key, version
+    return best_str
+
 def get_highest_version():
     """Get the highest version from version_config.json"""
     try:
-        config_path = Path(__file__).parent.parent / "version_config.json"
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            # Get all versions from the configuration
-            versions = []
-            
-            # Add metadata version
-            if 'metadata' in config and 'version' in config['metadata']:
-                versions.append(config['metadata']['version'])
-            
-            # Add all file versions
-            if 'expected_versions' in config:
-                for category in config['expected_versions'].values():
-                    for file_info in category.values():
-                        if 'version' in file_info:
-                            versions.append(file_info['version'])
-            
-            # Find the highest version
-            if versions:
-                # Sort versions by converting to tuples of integers
-                def version_key(v):
-                    return tuple(map(int, v.split('.')))
-                
-                highest = max(versions, key=version_key)
-                return highest
+        st = _VERSION_CONFIG.stat()
+        highest = _compute_highest(_VERSION_CONFIG, st.st_mtime, st.st_size)
+        if highest:
+            return highest
     except Exception:
         pass
     
@@ -53,12 +88,44 @@ def get_current_datetime():
     now = datetime.now()
     return now.strftime("%Y-%m-%d %H:%M")
 
-# Version information - dynamically determined
-SCRIPT_VERSION = get_highest_version()
-SCRIPT_DATE = get_current_datetime()
+# Version information - baked by tools/bake_version.py, computed if missing
+try:
+    from _version import SCRIPT_VERSION, SCRIPT_DATE
+except ImportError:
+    SCRIPT_VERSION = get_highest_version()
+    SCRIPT_DATE = get_current_datetime()
+
+_WRONG_ENV_MSG = """\
+======================================================================
+⚠️  AI Environment - Incorrect Launch Method
+======================================================================
+
+🚫 You are running this script directly outside the virtual environment!
+
+✅ CORRECT way to launch:
+   ~/Developer/AILab-Mac/run_ai_env.sh
+
+❌ INCORRECT (what you did):
+   python activate_ai_env.py
+   python ~/Developer/AILab-Mac/activate_ai_env.py
+
+📋 The run_ai_env.sh script will:
+   1. Set up the Python environment
+   2. Activate UV virtual environment
+   3. Install required packages (psutil, colorama)
+   4. Launch this script properly
+
+🔧 Please use: ./run_ai_env.sh
+======================================================================
+"""
 
 def check_environment():
     """Check if running in proper UV virtual environment"""
+    # run_ai_env.sh has already validated the environment before launching us;
+    # consume the flag so terminals and tools started from the menu don't inherit it
+    if os.environ.pop('AI_ENV_VALIDATED', None) == '1':
+        return
+
     # Check if we're in virtual environment
     venv_active = os.environ.get('VIRTUAL_ENV', '')
 
@@ -71,27 +138,7 @@ def check_environment():
 
     # If not in virtual environment or psutil not available, show guidance
     if not venv_active or not psutil_available:
-        print("=" * 70)
-        print("⚠️  AI Environment - Incorrect Launch Method")
-        print("=" * 70)
-        print()
-        print("🚫 You are running this script directly outside the virtual environment!")
-        print()
-        print("✅ CORRECT way to launch:")
-        print("   ~/Developer/AILab-Mac/run_ai_env.sh")
-        print()
-        print("❌ INCORRECT (what you did):")
-        print("   python activate_ai_env.py")
-        print("   python ~/Developer/AILab-Mac/activate_ai_env.py")
-        print()
-        print("📋 The run_ai_env.sh script will:")
-        print("   1. Set up the Python environment")
-        print("   2. Activate UV virtual environment")
-        print("   3. Install required packages (psutil, colorama)")
-        print("   4. Launch this script properly")
-        print()
-        print("🔧 Please use: ./run_ai_env.sh")
-        print("=" * 70)
+        sys.stdout.write(_WRONG_ENV_MSG)
 
         # Ask user if they want to continue anyway
         try:
@@ -125,12 +172,128 @@ except ImportError:
     class Style:
         RESET_ALL = ""
 
-from ai_menu_system import MenuSystem
-from ai_action_handlers import ActionHandlers
+# ANSI prefixes never change at runtime, so build them once
+_GREEN = Fore.GREEN
+_YELLOW = Fore.YELLOW
+_CYAN = Fore.CYAN
+_RED = Fore.RED
+_RESET = Style.RESET_ALL
+_INFO = f"{_YELLOW}[INFO] "
+
+class _VerboseFormatter(logging.Formatter):
+    """Format records as colored [VERBOSE] lines; the color comes from extra"""
+
+    def format(self, record):
+        return f"{getattr(record, 'color', _CYAN)}[VERBOSE] {record.getMessage()}{_RESET}"
+
+# [VERBOSE] output is DEBUG logging, so disabled messages are never formatted
+log = logging.getLogger("ai_env")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(_VerboseFormatter())
+log.addHandler(_handler)
+log.propagate = False
+log.setLevel(logging.INFO)
+
+_LOG_GREEN = {"color": _GREEN}
+_LOG_YELLOW = {"color": _YELLOW}
+_LOG_CYAN = {"color": _CYAN}
+_LOG_RED = {"color": _RED}
+
+def set_verbose(verbose):
+    """Enable or disable [VERBOSE] output"""
+    log.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+@functools.lru_cache(maxsize=64)
+def _dir_entries(dir_path):
+    """List a directory once per process; names are casefolded on Windows"""
+    try:
+        with os.scandir(dir_path) as entries:
+            if os.name == 'nt':
+                return frozenset(entry.name.casefold() for entry in entries)
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+def _has_entry(path):
+    """Check whether a path exists using its parent's cached directory listing"""
+    name = path.name.casefold() if os.name == 'nt' else path.name
+    if name in _dir_entries(str(path.parent)):
+        return True
+    # A listing miss may only differ in case (macOS volumes are usually
+    # case-insensitive) or come from an unlistable parent, so ask the filesystem
+    return path.exists()
+
+# User profile locations never change during a run, so resolve them once
+_USER_PROFILE = Path(os.environ.get('USERPROFILE', ''))
+_LOCAL_APPDATA = Path(os.environ.get('LOCALAPPDATA', ''))
+
+# Installed Ollama locations, user profile first, then system-wide
+_OLLAMA_CANDIDATES = (
+    _USER_PROFILE / "Ollama" / "ollama.exe",
+    _LOCAL_APPDATA / "Programs" / "Ollama" / "ollama.exe",
+    Path("C:/Program Files/Ollama/ollama.exe"),
+    Path("C:/Program Files (x86)/Ollama/ollama.exe"),
+)
+
+# Detected paths persisted between runs, keyed by the src directory and AI_ENV_PATH they were detected from
+PATH_CACHE_FILE = Path.home() / ".cache" / "ai_env" / "paths.json"
 
 class AIEnvironmentActivator:
     """Main AI Environment activation and management system"""
 
+    # Paths detection actually found (not fallback defaults) per cache key for this process
+    _detected_paths = {}
+
+    def _found_paths(self, ai_env_path, ollama_path):
+        """Keep only paths detection really found, so fallback defaults are re-detected next time"""
+        found = {}
+        if not _has_entry(ai_env_path / "Ollama"):
+            return found
+        found['ai_env_path'] = ai_env_path
+        # An installed Ollama only stands while no portable one has appeared
+        portable = next((path for path in (ai_env_path / "Ollama" / "ollama.exe",
+                                           ai_env_path / "AI_Environment" / "Ollama" / "ollama.exe")
+                         if _has_entry(path)), None)
+        if ollama_path is not None and portable in (None, ollama_path) and _has_entry(ollama_path):
+            found['ollama_path'] = ollama_path
+        return found
+
+    def _load_cached_paths(self, cache_key):
+        """Return previously found paths by name; the caller re-checks them"""
+        paths = self._detected_paths.get(cache_key)
+        if paths is not None:
+            return paths
+
+        try:
+            entry = json.loads(PATH_CACHE_FILE.read_text(encoding='utf-8')).get(cache_key) or {}
+            paths = {key: Path(value) for key, value in entry.items()}
+        except Exception:
+            return {}
+
+        if paths:
+            log.debug("Using cached paths from: %s", PATH_CACHE_FILE, extra=_LOG_GREEN)
+        return paths
+
+    def _save_cached_paths(self, cache_key, paths):
+        """Remember found paths for later instances and runs"""
+        self._detected_paths[cache_key] = paths
+        try:
+            try:
+                cache = json.loads(PATH_CACHE_FILE.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                cache = {}
+            entry = {key: str(path) for key, path in paths.items()}
+            if cache.get(cache_key, {}) == entry:
+                return
+            if entry:
+                cache[cache_key] = entry
+            else:
+                cache.pop(cache_key, None)
+            PATH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            PATH_CACHE_FILE.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+        except Exception as e:
+            log.debug("Could not save path cache: %s", e, extra=_LOG_YELLOW)
+
     def _detect_venv_path(self):
         """
         Detect UV virtual environment location.
@@ -143,14 +306,12 @@ class AIEnvironmentActivator:
 
         # 1. Check standard location first (PRIORITY)
         venv_path = self.ai_env_path / ".venv"
-        if (venv_path / "bin" / "python").exists():
-            if self.verbose:
-                print(f"{Fore.GREEN}[VERBOSE] Found UV virtual environment at: {venv_path}{Style.RESET_ALL}")
+        if _has_entry(venv_path / "bin" / "python"):
+            log.debug("Found UV virtual environment at: %s", venv_path, extra=_LOG_GREEN)
             return venv_path
 
         # Default to standard location even if it doesn't exist (will be created during setup)
-        if self.verbose:
-            print(f"{Fore.YELLOW}[VERBOSE] Virtual environment not found, defaulting to: {venv_path}{Style.RESET_ALL}")
+        log.debug("Virtual environment not found, defaulting to: %s", venv_path, extra=_LOG_YELLOW)
         return venv_path
 
     def _detect_ollama_path(self):
@@ -159,78 +320,70 @@ class AIEnvironmentActivator:
         Priority order:
         1. Portable: {ai_env_path}/Ollama (preferred for portability)
         2. Installer portable: {ai_env_path}/AI_Environment/Ollama (when installer output is moved here)
-        3. PATH variable: Extract from 'which ollama.exe'
+        3. PATH variable: shutil.which('ollama')
         4. User profile: %USERPROFILE%/Ollama or %LOCALAPPDATA%/Programs/Ollama
         5. System-wide: C:/Program Files/Ollama
         """
-        import subprocess
-        import os
 
         # 1. Check portable installation first (PRIORITY)
         portable_path = self.ai_env_path / "Ollama" / "ollama.exe"
-        if portable_path.exists():
-            if self.verbose:
-                print(f"{Fore.GREEN}[VERBOSE] Found portable Ollama at: {portable_path}{Style.RESET_ALL}")
+        if _has_entry(portable_path):
+            log.debug("Found portable Ollama at: %s", portable_path, extra=_LOG_GREEN)
             return portable_path
 
         # 2. Check AI_Environment subfolder (installer output moved here)
         installer_portable_path = self.ai_env_path / "AI_Environment" / "Ollama" / "ollama.exe"
-        if installer_portable_path.exists():
-            if self.verbose:
-                print(f"{Fore.GREEN}[VERBOSE] Found Ollama in AI_Environment at: {installer_portable_path}{Style.RESET_ALL}")
+        if _has_entry(installer_portable_path):
+            log.debug("Found Ollama in AI_Environment at: %s", installer_portable_path, extra=_LOG_GREEN)
             return installer_portable_path
 
         # 3. Try to detect from PATH environment variable
-        try:
-            result = subprocess.run(['which', 'ollama.exe'],
-                                  capture_output=True,
-                                  text=True,
-                                  timeout=5)
-            if result.returncode == 0:
-                ollama_exe_path = Path(result.stdout.strip().split('\n')[0].strip())
-                if self.verbose:
-                    print(f"{Fore.YELLOW}[VERBOSE] Found Ollama in PATH at: {ollama_exe_path}{Style.RESET_ALL}")
-                return ollama_exe_path
-        except Exception as e:
-            if self.verbose:
-                print(f"{Fore.YELLOW}[VERBOSE] Could not detect Ollama from PATH: {e}{Style.RESET_ALL}")
-
-        # 3. Check common user profile locations
-        user_profile = Path(os.environ.get('USERPROFILE', ''))
-        local_appdata = Path(os.environ.get('LOCALAPPDATA', ''))
-
-        user_locations = [
-            user_profile / "Ollama" / "ollama.exe",
-            local_appdata / "Programs" / "Ollama" / "ollama.exe",
-        ]
-
-        for ollama_path in user_locations:
-            if ollama_path.exists():
-                if self.verbose:
-                    print(f"{Fore.YELLOW}[VERBOSE] Found Ollama at: {ollama_path}{Style.RESET_ALL}")
-                return ollama_path
-
-        # 4. Check common system-wide locations
-        system_locations = [
-            Path("C:/Program Files/Ollama/ollama.exe"),
-            Path("C:/Program Files (x86)/Ollama/ollama.exe"),
-        ]
-
-        for ollama_path in system_locations:
-            if ollama_path.exists():
-                if self.verbose:
-                    print(f"{Fore.YELLOW}[VERBOSE] Found Ollama at: {ollama_path}{Style.RESET_ALL}")
-                return ollama_path
+        ollama_exe = shutil.which('ollama') or shutil.which('ollama.exe')
+        if ollama_exe:
+            ollama_exe_path = Path(ollama_exe)
+            log.debug("Found Ollama in PATH at: %s", ollama_exe_path, extra=_LOG_YELLOW)
+            return ollama_exe_path
+
+        # 4./5. Check common user profile, then system-wide locations in one pass
+        found = next((path for path in _OLLAMA_CANDIDATES if _has_entry(path)), None)
+        if found:
+            log.debug("Found Ollama at: %s", found, extra=_LOG_YELLOW)
+            return found
 
         # Return None if not found (Ollama is optional)
-        if self.verbose:
-            print(f"{Fore.RED}[VERBOSE] Ollama not found, will use portable location: {portable_path}{Style.RESET_ALL}")
+        log.debug("Ollama not found, will use portable location: %s", portable_path, extra=_LOG_RED)
         return portable_path
 
-    def _find_ai_environment(self):
+    # Drive letters already searched without finding AI_Environment
+    _empty_drives = set()
+
+    def _probe_drive(self, drive_path):
+        """
+        Look for AI_Lab/AI_Environment (external) or AI_Environment (internal)
+        on one drive, listing the drive root once instead of probing each path.
+        """
+        try:
+            with os.scandir(drive_path) as entries:
+                names = {entry.name.casefold() for entry in entries if entry.is_dir()}
+        except OSError:
+            return None
+
+        candidates = []
+        if 'ai_lab' in names:
+            candidates.append(drive_path / "AI_Lab" / "AI_Environment")
+        if 'ai_environment' in names:
+            candidates.append(drive_path / "AI_Environment")
+
+        for candidate in candidates:
+            if _has_entry(candidate / "Ollama"):
+                return candidate
+        return None
+
+    def _find_ai_environment(self, cached_path=None):
         """
         Find AI_Environment installation across all drives.
-        Searches for AI_Environment in both external (AI_Lab) and internal locations.
+        Searches for AI_Environment in both external (AI_Lab) and internal locations;
+        cached_path, found by an earlier run, is tried before sweeping drives.
 
         Returns:
             Path to AI_Environment or current directory if not found
@@ -238,175 +391,236 @@ class AIEnvironmentActivator:
         import string
 
         # First, check if we're already inside AI_Environment
-        script_dir = Path(__file__).resolve().parent
-        current_path = script_dir.parent
+        current_path = _ROOT
 
         # Check if current directory is AI_Environment
-        if (current_path / "Ollama").exists():
-            if self.verbose:
-                print(f"{Fore.GREEN}[VERBOSE] Found AI_Environment at current location: {current_path}{Style.RESET_ALL}")
+        if _has_entry(current_path / "Ollama"):
+            log.debug("Found AI_Environment at current location: %s", current_path, extra=_LOG_GREEN)
             return current_path
 
-        # Search all drives for AI_Environment
-        for letter in string.ascii_uppercase:
-            drive_path = Path(f"{letter}:\\")
-
-            if not drive_path.exists():
-                continue
-
-            # Check AI_Lab\AI_Environment (external drives)
-            ai_lab_path = drive_path / "AI_Lab" / "AI_Environment"
-            if ai_lab_path.exists() and ai_lab_path.is_dir():
-                if (ai_lab_path / "Ollama").exists():
-                    if self.verbose:
-                        print(f"{Fore.GREEN}[VERBOSE] Found AI_Environment at: {ai_lab_path}{Style.RESET_ALL}")
-                    return ai_lab_path
-
-            # Check Drive:\AI_Environment (internal drives)
-            ai_env_path = drive_path / "AI_Environment"
-            if ai_env_path.exists() and ai_env_path.is_dir():
-                if (ai_env_path / "Ollama").exists():
-                    if self.verbose:
-                        print(f"{Fore.GREEN}[VERBOSE] Found AI_Environment at: {ai_env_path}{Style.RESET_ALL}")
-                    return ai_env_path
+        # An explicitly exported AI_ENV_PATH wins over searching drives
+        env_path = os.environ.get('AI_ENV_PATH')
+        if env_path and (Path(env_path) / "Ollama").exists():
+            log.debug("Found AI_Environment from AI_ENV_PATH: %s", env_path, extra=_LOG_GREEN)
+            return Path(env_path)
+
+        if cached_path and _has_entry(cached_path / "Ollama"):
+            log.debug("Found AI_Environment from path cache: %s", cached_path, extra=_LOG_GREEN)
+            return cached_path
+
+        # Drive letters only exist on Windows
+        if os.name == 'nt':
+            # Likeliest drives first: the script's own drive, then C: and D:
+            preferred = [_SRC_DIR.drive.upper().rstrip(':'), 'C', 'D']
+            letters = [letter for letter in dict.fromkeys(preferred + list(string.ascii_uppercase))
+                       if letter and letter not in self._empty_drives]
+
+            # Probe drives concurrently so slow or spun-down drives overlap;
+            # results are consumed in preference order so the winner is stable
+            executor = ThreadPoolExecutor(max_workers=8)
+            try:
+                drives = [Path(f"{letter}:\\") for letter in letters]
+                for letter, found in zip(letters, executor.map(self._probe_drive, drives)):
+                    if found:
+                        log.debug("Found AI_Environment at: %s", found, extra=_LOG_GREEN)
+                        return found
+                    self._empty_drives.add(letter)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
 
         # Fallback to current directory
-        if self.verbose:
-            print(f"{Fore.YELLOW}[VERBOSE] AI_Environment not found on any drive, using current: {current_path}{Style.RESET_ALL}")
+        log.debug("AI_Environment not found on any drive, using current: %s", current_path, extra=_LOG_YELLOW)
         return current_path
 
     def __init__(self, verbose=False):
         self.verbose = verbose
+        set_verbose(verbose)
+
+        # Reuse earlier detection results that still hold; AI_ENV_PATH is part
+        # of the key so a path found under one setting never leaks into another
+        cache_key = f"{_SRC_DIR}|{os.environ.get('AI_ENV_PATH', '')}"
+        cached_paths = self._load_cached_paths(cache_key)
 
         # Find AI_Environment installation (searches all drives)
-        self.ai_env_path = self._find_ai_environment()
+        self.ai_env_path = self._find_ai_environment(cached_paths.get('ai_env_path'))
 
         # Detect UV virtual environment location
         self.venv_path = self._detect_venv_path()
 
-        # Detect actual Ollama location (portable first, then system)
-        self.ollama_path = self._detect_ollama_path()
+        # Detect actual Ollama location (portable first, then system); a cached
+        # one only counts for the AI_Environment it was detected with
+        cached_ollama = None
+        if cached_paths.get('ai_env_path') == self.ai_env_path:
+            cached_ollama = self._found_paths(self.ai_env_path, cached_paths.get('ollama_path')).get('ollama_path')
+        self.ollama_path = cached_ollama or self._detect_ollama_path()
 
-        # Initialize subsystems
-        self.menu_system = MenuSystem(SCRIPT_VERSION, SCRIPT_DATE)
-        self.action_handlers = ActionHandlers(self.ai_env_path, self.venv_path, self.ollama_path)
+        self._save_cached_paths(cache_key, self._found_paths(self.ai_env_path, self.ollama_path))
 
-        if self.verbose:
-            print(f"{Fore.CYAN}[VERBOSE] {__file__} v{SCRIPT_VERSION} ({SCRIPT_DATE}) starting{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}[VERBOSE] AI Environment path: {self.ai_env_path}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}[VERBOSE] Virtual environment path: {self.venv_path}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}[VERBOSE] Ollama path: {self.ollama_path}{Style.RESET_ALL}")
+        log.debug("%s v%s (%s) starting", __file__, SCRIPT_VERSION, SCRIPT_DATE, extra=_LOG_CYAN)
+        log.debug("AI Environment path: %s", self.ai_env_path, extra=_LOG_CYAN)
+        log.debug("Virtual environment path: %s", self.venv_path, extra=_LOG_CYAN)
+        log.debug("Ollama path: %s", self.ollama_path, extra=_LOG_CYAN)
             
+    # Subsystems are imported and built on first use, so command line actions
+    # that never open the menu don't pay for loading it
+    @functools.cached_property
+    def menu_system(self):
+        from ai_menu_system import MenuSystem
+        return MenuSystem(SCRIPT_VERSION, SCRIPT_DATE)
+
+    # Header and static menu text are identical on every pass of the menu loop
+    @functools.cached_property
+    def _header_text(self):
+        return self.menu_system.build_header_string()
+
+    @functools.cached_property
+    def _menu_text(self):
+        return self.menu_system.build_menu_strings()
+
+    @functools.cached_property
+    def action_handlers(self):
+        from ai_action_handlers import ActionHandlers
+        return ActionHandlers(self.ai_env_path, self.venv_path, self.ollama_path)
+
     def print_info(self, message):
         """Print info message"""
-        print(f"{Fore.YELLOW}[INFO] {message}{Style.RESET_ALL}")
+        sys.stdout.write(_INFO + message + _RESET + "\n")
+        
+    @functools.cached_property
+    def _menu_actions(self):
+        """
+        Main menu choice -> (handler, kind). "result" handlers return a
+        success flag, "menu" submenus always count as success, and "direct"
+        entries go straight back to the main menu without a result line.
+        """
+        handlers = self.action_handlers
+        return {
+            1: (handlers.action_full_activation, "result"),  # Full activation
+            2: (handlers.action_restore_path, "result"),  # Restore PATH
+            3: (handlers.action_activate_venv, "result"),  # Activate virtual environment only
+            4: (handlers.action_test_components, "result"),  # Test components
+            5: (handlers.action_setup_flask, "result"),  # Setup Flask
+            6: (handlers.action_setup_ollama, "result"),  # Setup Ollama
+            7: (handlers.action_download_models, "result"),  # Download models
+            8: (handlers.action_run_validation, "result"),  # Run validation
+            9: (handlers.handle_launch_menu, "menu"),  # Launch applications
+            10: (handlers.handle_background_menu, "menu"),  # Background processes
+            11: (handlers.handle_advanced_menu, "direct"),  # Advanced options
+            12: (handlers.handle_terminal_launcher, "direct"),  # Open AILab Terminal
+            13: (handlers.handle_help_menu, "direct"),  # Version & Documentation
+        }
+
+    def _stop_background_processes(self):
+        """Stop and forget every tracked background process"""
+        self.print_info("Stopping all background processes and exiting...")
+        try:
+            from ai_process_manager import BackgroundProcessManager
+            process_manager = BackgroundProcessManager(self.ai_env_path)
+            
+            # Get all tracked processes (loaded, minus dead ones, by the manager)
+            tracked_processes = process_manager.tracked_processes
+            if tracked_processes:
+                self.print_info(f"Found {len(tracked_processes)} background processes to stop...")
+                
+                # Stop all processes
+                targets = []
+                for process_id, process_info in tracked_processes.items():
+                    pid = process_info.get('pid')
+                    if pid:
+                        targets.append((process_id, pid, process_info.get('name', 'Unknown')))
+                
+                if os.name == 'nt':
+                    # One taskkill call for every PID instead of one process per PID
+                    import subprocess
+                    args = ['taskkill', '/F']
+                    for _, pid, _ in targets:
+                        args += ['/PID', str(pid)]
+                    try:
+                        result = subprocess.run(args, capture_output=True, text=True) if targets else None
+                        stopped_lines = [line for line in (result.stdout if result else '').splitlines()
+                                         if line.startswith('SUCCESS')]
+                        for process_id, pid, name in targets:
+                            if any(f"PID {pid} " in line for line in stopped_lines):
+                                self.print_info(f"Stopped {name} (PID: {pid})")
+                            else:
+                                self.print_info(f"Process {name} (PID: {pid}) already stopped")
+                    except Exception as e:
+                        self.print_info(f"Could not stop background processes: {e}")
+                else:
+                    import signal
+                    for process_id, pid, name in targets:
+                        try:
+                            os.kill(int(pid), signal.SIGTERM)
+                            self.print_info(f"Stopped {name} (PID: {pid})")
+                        except ProcessLookupError:
+                            self.print_info(f"Process {name} (PID: {pid}) already stopped")
+                        except Exception as e:
+                            self.print_info(f"Could not stop process {process_id}: {e}")
+                
+                # Clear the background processes file
+                process_manager.tracked_processes = {}
+                process_manager.save_tracked_processes()
+                self.print_info("All background processes stopped and cleared")
+            else:
+                self.print_info("No background processes found")
+                
+        except Exception as e:
+            self.print_info(f"Error stopping background processes: {e}")
         
     def run_interactive_menu(self):
         """Run interactive menu system"""
         while True:
-            self.menu_system.print_header()
-            self.menu_system.print_interactive_menu()
+            menu_before, menu_after = self._menu_text
+            sys.stdout.write(self._header_text)
+            sys.stdout.write(menu_before + self.menu_system.build_background_processes_line() + menu_after)
             
             choice = self.menu_system.get_user_choice(15)
             
             if choice == 0:  # Exit
                 self.print_info("Exiting AI Environment Manager...")
                 break
-            elif choice == 1:  # Full activation
-                success = self.action_handlers.action_full_activation()
-            elif choice == 2:  # Restore PATH
-                success = self.action_handlers.action_restore_path()
-            elif choice == 3:  # Activate virtual environment only
-                success = self.action_handlers.action_activate_venv()
-            elif choice == 4:  # Test components
-                success = self.action_handlers.action_test_components()
-            elif choice == 5:  # Setup Flask
-                success = self.action_handlers.action_setup_flask()
-            elif choice == 6:  # Setup Ollama
-                success = self.action_handlers.action_setup_ollama()
-            elif choice == 7:  # Download models
-                success = self.action_handlers.action_download_models()
-            elif choice == 8:  # Run validation
-                success = self.action_handlers.action_run_validation()
-            elif choice == 9:  # Launch applications
-                self.action_handlers.handle_launch_menu()
-                success = True  # Menu operations don't return success/failure
-            elif choice == 10:  # Background processes
-                self.action_handlers.handle_background_menu()
-                success = True  # Menu operations don't return success/failure
-            elif choice == 11:  # Advanced options
-                self.action_handlers.handle_advanced_menu()
-                continue
-            elif choice == 12:  # Open AILab Terminal
-                self.action_handlers.handle_terminal_launcher()
-                continue
-            elif choice == 13:  # Version & Documentation
-                self.action_handlers.handle_help_menu()
-                continue
             elif choice == 14:  # Quit (leave processes running)
                 self.print_info("Quitting AI Environment Manager...")
                 self.print_info("Background processes will continue running")
                 break
             elif choice == 15:  # Exit and close all
-                self.print_info("Stopping all background processes and exiting...")
-                try:
-                    from ai_process_manager import BackgroundProcessManager
-                    process_manager = BackgroundProcessManager(self.ai_env_path)
-                    
-                    # Get all tracked processes
-                    tracked_processes = process_manager.load_tracked_processes()
-                    if tracked_processes:
-                        self.print_info(f"Found {len(tracked_processes)} background processes to stop...")
-                        
-                        # Stop all processes
-                        for process_id, process_info in tracked_processes.items():
-                            try:
-                                pid = process_info.get('pid')
-                                name = process_info.get('name', 'Unknown')
-                                
-                                if pid:
-                                    # Try to terminate the process
-                                    import subprocess
-                                    try:
-                                        subprocess.run(['taskkill', '/F', '/PID', str(pid)], 
-                                                     check=True, capture_output=True)
-                                        self.print_info(f"Stopped {name} (PID: {pid})")
-                                    except subprocess.CalledProcessError:
-                                        self.print_info(f"Process {name} (PID: {pid}) already stopped")
-                            except Exception as e:
-                                self.print_info(f"Could not stop process {process_id}: {e}")
-                        
-                        # Clear the background processes file
-                        process_manager.tracked_processes = {}
-                        process_manager.save_tracked_processes()
-                        self.print_info("All background processes stopped and cleared")
-                    else:
-                        self.print_info("No background processes found")
-                        
-                except Exception as e:
-                    self.print_info(f"Error stopping background processes: {e}")
-                
+                self._stop_background_processes()
                 self.print_info("Exiting AI Environment Manager...")
                 break
-            else:
-                success = False
+            
+            handler, kind = self._menu_actions[choice]
+            if kind == "direct":
+                handler()
+                continue
+            
+            success = handler()
+            if kind == "menu":
+                success = True  # Menu operations don't return success/failure
                 
             # Show result for actions 1-10
-            if choice in range(1, 11):
-                if success:
-                    print(f"\n{Fore.GREEN}✅ Action completed successfully!{Style.RESET_ALL}")
-                else:
-                    print(f"\n{Fore.RED}❌ Action failed. Check messages above.{Style.RESET_ALL}")
-                    
-                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            if success:
+                print(f"\n{_GREEN}✅ Action completed successfully!{_RESET}")
+            else:
+                print(f"\n{_RED}❌ Action failed. Check messages above.{_RESET}")
+                
+            input(f"\n{_YELLOW}Press Enter to continue...{_RESET}")
+
+# Command line action -> ActionHandlers method
+CLI_ACTIONS = {
+    "activate": lambda handlers: handlers.action_full_activation(),
+    "restore": lambda handlers: handlers.action_restore_path(),
+    "venv": lambda handlers: handlers.action_activate_venv(),
+    "status": lambda handlers: handlers.action_show_status(),
+    "test": lambda handlers: handlers.action_test_components(),
+}
 
 def main():
     """Main entry point"""
     # Check for verbose mode
     verbose_mode = "--verbose" in sys.argv
+    set_verbose(verbose_mode)
     
-    if verbose_mode:
-        print(f"{Fore.CYAN}[VERBOSE] Command line arguments: {sys.argv}{Style.RESET_ALL}")
+    log.debug("Command line arguments: %s", sys.argv, extra=_LOG_CYAN)
     
     # Create activator instance
     activator = AIEnvironmentActivator(verbose=verbose_mode)
@@ -415,34 +629,27 @@ def main():
     if len(sys.argv) > 1:
         action = sys.argv[1].lower()
         
-        if action == "activate":
-            success = activator.action_handlers.action_full_activation()
-        elif action == "restore":
-            success = activator.action_handlers.action_restore_path()
-        elif action == "venv":
-            success = activator.action_handlers.action_activate_venv()
-        elif action == "status":
-            success = activator.action_handlers.action_show_status()
-        elif action == "test":
-            success = activator.action_handlers.action_test_components()
+        handler = CLI_ACTIONS.get(action)
+        if handler is not None:
+            success = handler(activator.action_handlers)
         elif action == "--verbose":
             # Only --verbose was provided, show status and exit
             if verbose_mode:
-                print(f"{Fore.CYAN}[VERBOSE] No action specified, showing status and exiting{Style.RESET_ALL}")
+                log.debug("No action specified, showing status and exiting", extra=_LOG_CYAN)
                 activator.action_handlers.action_show_status()
             else:
                 # Run interactive menu
                 activator.run_interactive_menu()
             return
         else:
-            print(f"{Fore.RED}[ERROR] Unknown action: {action}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}[INFO] Available actions: activate, restore, venv, status, test{Style.RESET_ALL}")
+            print(f"{_RED}[ERROR] Unknown action: {action}{_RESET}")
+            print(f"{_YELLOW}[INFO] Available actions: {', '.join(CLI_ACTIONS)}{_RESET}")
             return
                 
         if success:
-            print(f"\n{Fore.GREEN}Action completed successfully!{Style.RESET_ALL}")
+            print(f"\n{_GREEN}Action completed successfully!{_RESET}")
         else:
-            print(f"\n{Fore.RED}Action failed!{Style.RESET_ALL}")
+            print(f"\n{_RED}Action failed!{_RESET}")
     else:
         # Run interactive menu
         activator.run_interactive_menu()
@@ -12,8 +12,15 @@ AI Environment - Action Handlers Module
 Handles all menu actions and operations
 """
 
-from pathlib import Path
+import functools
+import importlib
+import os
+import subprocess
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 try:
     from colorama import Fore, Style
@@ -24,13 +31,49 @@ except ImportError:
         RESET_ALL = ""
 
 from ai_path_manager import PathManager
-from ai_uv_manager import UVManager
-from ai_component_setup import ComponentSetup
 from ai_status_display import StatusDisplay
-from ai_component_tester import ComponentTester
 from ai_ollama_manager import OllamaManager
-from ai_app_launcher import ApplicationLauncher
-from ai_process_manager import BackgroundProcessManager
+from ai_menu_system import MenuSystem
+
+# Heavier subsystems are imported on first use; a session usually touches
+# only a few of them (resolved by __getattr__ below)
+_LAZY_IMPORTS = {
+    "UVManager": "ai_uv_manager",
+    "ComponentSetup": "ai_component_setup",
+    "ComponentTester": "ai_component_tester",
+    "get_application_launcher": "ai_app_launcher",
+    "BackgroundProcessManager": "ai_process_manager",
+    "DocumentViewer": "ai_document_viewer",
+    "ModelLoader": "ai_model_loader",
+    "AIModelManager": "ai_model_manager",
+    "JupyterLabManager": "ai_jupyter_manager",
+}
+
+def __getattr__(name):
+    """Import a lazily loaded subsystem class on first access (PEP 562)"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+# Bare global lookups inside this module bypass __getattr__, so lazy
+# classes are reached through the module object instead
+_lazy = sys.modules[__name__]
+
+# Colored prefixes and separators never change, so build them once
+_PFX_STEP = f"{Fore.CYAN}[*] Step "
+_PFX_OK = f"{Fore.GREEN}[OK] "
+_PFX_ERR = f"{Fore.RED}[ERROR] "
+_PFX_INFO = f"{Fore.YELLOW}[INFO] "
+_PFX_WARN = f"{Fore.YELLOW}[WARNING] "
+_SFX = Style.RESET_ALL
+_STEP_SEP = f"{Fore.CYAN}{'-'*50}{Style.RESET_ALL}"
+_EQ_SEP = f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}"
+
+# Where main() remembers the AI_Environment it found last time
+AI_ENV_CACHE_FILE = Path.home() / ".cache" / "ai_env" / "ai_env_path"
 
 class ActionHandlers:
     """Handles all menu actions for AI Environment"""
@@ -43,27 +86,74 @@ class ActionHandlers:
             ollama_path = Path(ai_env_path) / "Ollama" / "ollama.exe"
         self.ollama_path = Path(ollama_path)
         self.ollama_manager = OllamaManager(ai_env_path, ollama_path)
+        # MenuSystem holds only the version strings, so one instance serves every submenu
+        self._menu = MenuSystem("3.0.28", "2025-08-13")
+        # Helper script locations are fixed for the handler's lifetime; kept as
+        # strings so subprocess calls need no further conversion
+        self._cwd = str(self.ai_env_path)
+        self._verify_checksums_script = os.path.join(self._cwd, "src", "verify_checksums.py")
+        self._check_versions_script = os.path.join(self._cwd, "src", "check_versions.py")
         
+    # Managers are built on first use and then reused by every action
+    @functools.cached_property
+    def path_manager(self):
+        return PathManager(self.ai_env_path)
+
+    @functools.cached_property
+    def uv_manager(self):
+        return _lazy.UVManager(self.venv_path)
+
+    @functools.cached_property
+    def process_manager(self):
+        return _lazy.BackgroundProcessManager(self.ai_env_path)
+
+    def _synced_process_manager(self):
+        """Return the shared process manager, reloaded from the tracking file"""
+        # Launchers track processes through their own managers, so resync an
+        # existing instance; a freshly built one has just read the file
+        if 'process_manager' in self.__dict__:
+            self.process_manager.load_tracked_processes()
+        return self.process_manager
+
+    def _wait_for_enter(self):
+        """Prompt for Enter, pruning dead tracked processes while the user reads"""
+        cleanup = threading.Thread(target=self._cleanup_tracked_processes, daemon=True)
+        cleanup.start()
+        input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+        # Finish before the next action touches the shared process manager
+        cleanup.join()
+
+    def _cleanup_tracked_processes(self):
+        """Drop tracked processes that are no longer running"""
+        try:
+            self._synced_process_manager().cleanup_dead_processes()
+        except Exception:
+            pass
+
     def print_step(self, step_num, description):
         """Print step header"""
-        print(f"{Fore.CYAN}[*] Step {step_num}: {description}...{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'-'*50}{Style.RESET_ALL}")
+        print(_PFX_STEP, step_num, ": ", description, "...", _SFX, sep="")
+        print(_STEP_SEP)
         
     def print_success(self, message):
         """Print success message"""
-        print(f"{Fore.GREEN}[OK] {message}{Style.RESET_ALL}")
+        print(_PFX_OK, message, _SFX, sep="")
         
     def print_error(self, message):
         """Print error message"""
-        print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+        print(_PFX_ERR, message, _SFX, sep="")
         
     def print_info(self, message):
         """Print info message"""
-        print(f"{Fore.YELLOW}[INFO] {message}{Style.RESET_ALL}")
+        print(_PFX_INFO, message, _SFX, sep="")
+        
+    def print_warning(self, message):
+        """Print warning message"""
+        print(_PFX_WARN, message, _SFX, sep="")
         
     def check_prerequisites(self):
         """Check if AI Environment is properly installed"""
-        if not self.ai_env_path.exists():
+        if not os.path.exists(self.ai_env_path):
             self.print_error(f"AI Environment not found at {self.ai_env_path}")
             self.print_info("Please run the installer first.")
             return False
@@ -80,17 +170,15 @@ class ActionHandlers:
                 
             # Step 1: Activate UV virtual environment first
             self.print_step(1, "Activating UV virtual environment")
-            uv_manager = UVManager(self.venv_path)
-            if not uv_manager.activate_environment():
+            if not self.uv_manager.activate_environment():
                 self.print_error("Failed to activate UV virtual environment")
                 return False
             self.print_success("UV virtual environment activated")
             
             # Step 2: Clean only duplicate AI Environment paths (keep conda paths)
             self.print_step(2, "Cleaning duplicate paths")
-            path_manager = PathManager()
             # Only remove duplicate AI Environment paths, not all of them
-            current_path = path_manager.get_current_path()
+            current_path = self.path_manager.get_current_path()
             if "\\AI_Environment" in current_path:
                 self.print_info("Removing duplicate AI Environment paths...")
                 # This is a lighter cleanup that preserves conda paths
@@ -100,7 +188,7 @@ class ActionHandlers:
             
             # Step 3: Setup components
             self.print_step(3, "Setting up components")
-            component_setup = ComponentSetup(self.ai_env_path, self.ollama_path)
+            component_setup = _lazy.ComponentSetup(self.ai_env_path, self.ollama_path)
             if not component_setup.setup_all_components():
                 self.print_error("Component setup failed")
                 return False
@@ -108,10 +196,8 @@ class ActionHandlers:
             
             # Step 4: AI Model Selection and Loading
             self.print_step(4, "AI Model Selection")
-            from ai_model_loader import ModelLoader
-
             try:
-                model_loader = ModelLoader(
+                model_loader = _lazy.ModelLoader(
                     self.ollama_path,
                     self.ai_env_path / "help"
                 )
@@ -119,16 +205,22 @@ class ActionHandlers:
                 selected_model = model_loader.select_model_for_activation("phi:2.7b")
                 if selected_model:
                     self.print_info(f"Loading model: {selected_model}")
-                    if model_loader.load_model(selected_model):
+                    # Probe the Ollama server while the model loads; tracking only needs its PID
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        status_future = executor.submit(self.ollama_manager.get_ollama_status)
+                        loaded = model_loader.load_model(selected_model)
+                    if loaded:
                         self.print_success(f"Model {selected_model} loaded successfully")
                         
                         # Track the loaded model process
                         try:
-                            from ai_process_manager import BackgroundProcessManager
-                            process_manager = BackgroundProcessManager(self.ai_env_path)
+                            process_manager = self._synced_process_manager()
                             
                             # Get Ollama status to find PID
-                            status = self.ollama_manager.get_ollama_status()
+                            status = status_future.result()
+                            if not status.get('processes'):
+                                # The load itself may have started the server
+                                status = self.ollama_manager.get_ollama_status()
                             if status and status.get('processes'):
                                 pid = status['processes'][0]['pid']
                                 process_manager.track_process(
@@ -155,8 +247,7 @@ class ActionHandlers:
             
             # Show tracked background processes
             try:
-                from ai_process_manager import BackgroundProcessManager
-                process_manager = BackgroundProcessManager(self.ai_env_path)
+                process_manager = self._synced_process_manager()
                 print(f"\n{Fore.CYAN}🔄 Background Processes Status:{Style.RESET_ALL}")
                 process_manager.list_background_processes()
             except Exception as e:
@@ -171,18 +262,16 @@ class ActionHandlers:
     def action_restore_path(self):
         """Restore original PATH"""
         print(f"\n{Fore.YELLOW}🧹 Restoring Original PATH...{Style.RESET_ALL}")
-        path_manager = PathManager(self.ai_env_path)
-        return path_manager.restore_original_path()
+        return self.path_manager.restore_original_path()
         
     def action_activate_venv(self):
         """Activate UV virtual environment only"""
         print(f"\n{Fore.BLUE}🐍 Activating UV Virtual Environment...{Style.RESET_ALL}")
-        uv_manager = UVManager(self.venv_path)
-        return uv_manager.activate_environment()
+        return self.uv_manager.activate_environment()
         
     def action_test_components(self):
         """Test all components"""
-        tester = ComponentTester(self.ai_env_path, self.venv_path)
+        tester = _lazy.ComponentTester(self.ai_env_path, self.venv_path)
         return tester.run_all_tests()
         
     def action_setup_flask(self):
@@ -201,11 +290,8 @@ class ActionHandlers:
         """Download AI models"""
         print(f"\n{Fore.MAGENTA}📥 AI Model Management...{Style.RESET_ALL}")
 
-        # Import and initialize AI model manager
-        from ai_model_manager import AIModelManager
-
         try:
-            model_manager = AIModelManager(self.ai_env_path, self.ollama_path)
+            model_manager = _lazy.AIModelManager(self.ai_env_path, self.ollama_path)
             model_manager.run_interactive_menu()
             return True
         except Exception as e:
@@ -228,132 +314,123 @@ class ActionHandlers:
         
     def handle_launch_menu(self):
         """Handle application launcher menu"""
-        app_launcher = ApplicationLauncher(self.ai_env_path)
+        app_launcher = _lazy.get_application_launcher(self.ai_env_path)
+        
+        menu = self._menu
+        # Choice number -> launcher, looked up once per keypress
+        actions = {
+            1: app_launcher.launch_vscode,           # VS Code
+            2: self._run_jupyter_lab_menu,           # Jupyter Lab
+            3: app_launcher.launch_python_repl,      # Python REPL
+            4: app_launcher.launch_conda_prompt,     # Conda Prompt
+            5: app_launcher.launch_streamlit_demo,   # Streamlit
+            6: app_launcher.launch_tensorboard,      # TensorBoard
+            7: app_launcher.launch_mlflow_ui,        # MLflow
+            8: app_launcher.launch_file_explorer,    # File Explorer
+        }
         
         while True:
-            from ai_menu_system import MenuSystem
-            menu = MenuSystem("2.1.7", "2025-08-11")
             menu.print_launch_menu()
             
-            choice = menu.get_user_choice(8)
-            
-            if choice == 0:  # Back to main menu
+            handler = actions.get(menu.get_user_choice(8))
+            if handler is None:  # Back to main menu
                 break
-            elif choice == 1:  # VS Code
-                success = app_launcher.launch_vscode()
-            elif choice == 2:  # Jupyter Lab
-                self.handle_jupyter_lab_menu()
-                success = True  # Jupyter Lab menu handles its own success/error messages
-            elif choice == 3:  # Python REPL
-                success = app_launcher.launch_python_repl()
-            elif choice == 4:  # Conda Prompt
-                success = app_launcher.launch_conda_prompt()
-            elif choice == 5:  # Streamlit
-                success = app_launcher.launch_streamlit_demo()
-            elif choice == 6:  # TensorBoard
-                success = app_launcher.launch_tensorboard()
-            elif choice == 7:  # MLflow
-                success = app_launcher.launch_mlflow_ui()
-            elif choice == 8:  # File Explorer
-                success = app_launcher.launch_file_explorer()
-            else:
-                success = False
                 
-            if choice in range(1, 9):
-                if success:
-                    self.print_success("Application launched successfully")
-                else:
-                    self.print_error("Failed to launch application")
+            if handler():
+                self.print_success("Application launched successfully")
+            else:
+                self.print_error("Failed to launch application")
                     
-            input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            self._wait_for_enter()
             
     def handle_background_menu(self):
         """Handle background processes menu"""
-        process_manager = BackgroundProcessManager(self.ai_env_path)
+        process_manager = self._synced_process_manager()
+        
+        actions = {
+            1: process_manager.list_background_processes,  # List processes
+            2: self._prompt_stop_process,                  # Stop specific process
+            3: self._confirm_stop_all_processes,           # Stop all processes
+            4: self._refresh_process_list,                 # Refresh process list
+        }
         
+        menu = self._menu
         while True:
-            from ai_menu_system import MenuSystem
-            menu = MenuSystem("2.1.7", "2025-08-11")
             menu.print_background_menu()
             
-            choice = menu.get_user_choice(4)
-            
-            if choice == 0:  # Back to main menu
+            handler = actions.get(menu.get_user_choice(4))
+            if handler is None:  # Back to main menu
                 break
-            elif choice == 1:  # List processes
-                process_manager.list_background_processes()
-            elif choice == 2:  # Stop specific process
-                process_id = input(f"\n{Fore.CYAN}Enter process ID to stop: {Style.RESET_ALL}").strip()
-                if process_id:
-                    process_manager.stop_process(process_id)
-            elif choice == 3:  # Stop all processes
-                confirm = input(f"{Fore.YELLOW}Are you sure? This will stop all background processes (y/n): {Style.RESET_ALL}").lower()
-                if confirm == 'y':
-                    process_manager.stop_all_processes()
-            elif choice == 4:  # Refresh process list
-                process_manager.cleanup_dead_processes()
-                self.print_info("Process list refreshed")
+            handler()
                 
-            input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            self._wait_for_enter()
+            
+    def _prompt_stop_process(self):
+        """Ask for a process ID and stop that process"""
+        process_id = input(f"\n{Fore.CYAN}Enter process ID to stop: {Style.RESET_ALL}").strip()
+        if process_id:
+            self.process_manager.stop_process(process_id)
+            
+    def _confirm_stop_all_processes(self):
+        """Stop all background processes after confirmation"""
+        confirm = input(f"{Fore.YELLOW}Are you sure? This will stop all background processes (y/n): {Style.RESET_ALL}").lower()
+        if confirm == 'y':
+            self.process_manager.stop_all_processes()
+            
+    def _refresh_process_list(self):
+        """Drop dead processes from tracking"""
+        self.process_manager.cleanup_dead_processes()
+        self.print_info("Process list refreshed")
             
     def handle_advanced_menu(self):
         """Handle advanced options menu"""
+        actions = {
+            1: self.action_show_status,                                          # Show system status
+            2: self.ollama_manager.restart_ollama_server,                        # Restart Ollama
+            3: lambda: self._synced_process_manager().stop_all_processes(),      # Stop all background processes
+            4: lambda: self.print_info("Temporary file cleanup not yet implemented"),
+            5: lambda: self.print_info("Environment info export not yet implemented"),
+        }
+        
+        menu = self._menu
         while True:
-            from ai_menu_system import MenuSystem
-            menu = MenuSystem("3.0.28", "2025-08-13")
             menu.print_advanced_menu()
             
-            choice = menu.get_user_choice(5)
-            
-            if choice == 0:  # Back to main menu
+            handler = actions.get(menu.get_user_choice(5))
+            if handler is None:  # Back to main menu
                 break
-            elif choice == 1:  # Show system status
-                self.action_show_status()
-            elif choice == 2:  # Restart Ollama
-                self.ollama_manager.restart_ollama_server()
-            elif choice == 3:  # Stop all background processes
-                process_manager = BackgroundProcessManager(self.ai_env_path)
-                process_manager.stop_all_processes()
-            elif choice == 4:  # Clean temporary files
-                self.print_info("Temporary file cleanup not yet implemented")
-            elif choice == 5:  # Export environment info
-                self.print_info("Environment info export not yet implemented")
+            handler()
                 
-            input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            self._wait_for_enter()
 
     def handle_help_menu(self):
         """Handle version and documentation menu"""
+        # Choice number -> (handler, pause afterwards); the document viewers page themselves
+        actions = {
+            1: (self.view_readme, False),          # View README.md
+            2: (self.view_package_info, False),    # View PACKAGE_INFO.txt
+            3: (self.show_about_info, True),       # About AI Environment
+            4: (self.run_verify_checksums, True),  # Verify Checksums
+            5: (self.run_check_versions, True),    # Check Versions
+            6: (self.run_update_system, True),     # Update System
+        }
+        
+        menu = self._menu
         while True:
-            from ai_menu_system import MenuSystem
-            menu = MenuSystem("3.0.28", "2025-08-13")
             menu.print_help_menu()
             
-            choice = menu.get_user_choice(6)
-            
-            if choice == 0:  # Back to main menu
+            action = actions.get(menu.get_user_choice(6))
+            if action is None:  # Back to main menu
                 break
-            elif choice == 1:  # View README.md
-                self.view_readme()
-            elif choice == 2:  # View PACKAGE_INFO.txt
-                self.view_package_info()
-            elif choice == 3:  # About AI Environment
-                self.show_about_info()
-                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
-            elif choice == 4:  # Verify Checksums
-                self.run_verify_checksums()
-                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
-            elif choice == 5:  # Check Versions
-                self.run_check_versions()
-                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
-            elif choice == 6:  # Update System
-                self.run_update_system()
-                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            handler, pause = action
+            handler()
+            if pause:
+                self._wait_for_enter()
 
     def view_readme(self):
         """View README.md using document viewer"""
         try:
-            from ai_document_viewer import DocumentViewer
-            viewer = DocumentViewer(self.ai_env_path)
+            viewer = _lazy.DocumentViewer(self.ai_env_path)
             viewer.view_readme()
         except Exception as e:
             self.print_error(f"Error viewing README.md: {e}")
@@ -361,49 +438,42 @@ class ActionHandlers:
     def view_package_info(self):
         """View PACKAGE_INFO.txt using document viewer"""
         try:
-            from ai_document_viewer import DocumentViewer
-            viewer = DocumentViewer(self.ai_env_path)
+            viewer = _lazy.DocumentViewer(self.ai_env_path)
             viewer.view_package_info()
         except Exception as e:
             self.print_error(f"Error viewing PACKAGE_INFO.txt: {e}")
 
     def show_about_info(self):
         """Show About AI Environment information"""
-        from ai_menu_system import MenuSystem
-        menu = MenuSystem("3.0.28", "2025-08-13")
-        menu.print_about_info()
+        self._menu.print_about_info()
+
+    def _run_streamed(self, script_path):
+        """Run a Python script from the AI Environment directory, its output going straight to the terminal"""
+        # The child inherits our terminal: a pipe would make it block-buffer
+        # (and check_versions batch) its output until exit
+        sys.stdout.flush()
+        return subprocess.call([sys.executable, script_path], cwd=self._cwd)
 
     def run_verify_checksums(self):
         """Run verify_checksums.py script"""
-        import subprocess
-        import sys
-        
         try:
             self.print_info("Running checksum verification...")
-            print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+            print(_EQ_SEP)
             
             # Run verify_checksums.py
-            script_path = self.ai_env_path / "src" / "verify_checksums.py"
-            if not script_path.exists():
+            script_path = self._verify_checksums_script
+            if not os.path.isfile(script_path):
                 self.print_error("verify_checksums.py not found")
                 return False
             
             # Change to AI Environment directory and run the script
-            result = subprocess.run([
-                sys.executable, str(script_path)
-            ], cwd=str(self.ai_env_path), capture_output=True, text=True)
+            returncode = self._run_streamed(script_path)
             
-            # Display output
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(f"{Fore.RED}{result.stderr}{Style.RESET_ALL}")
-            
-            if result.returncode == 0:
+            if returncode == 0:
                 self.print_success("Checksum verification completed successfully")
                 return True
             else:
-                self.print_error(f"Checksum verification failed (exit code: {result.returncode})")
+                self.print_error(f"Checksum verification failed (exit code: {returncode})")
                 return False
                 
         except Exception as e:
@@ -412,35 +482,24 @@ class ActionHandlers:
 
     def run_check_versions(self):
         """Run check_versions.py script"""
-        import subprocess
-        import sys
-        
         try:
             self.print_info("Running version check...")
-            print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+            print(_EQ_SEP)
             
             # Run check_versions.py
-            script_path = self.ai_env_path / "src" / "check_versions.py"
-            if not script_path.exists():
+            script_path = self._check_versions_script
+            if not os.path.isfile(script_path):
                 self.print_error("check_versions.py not found")
                 return False
             
             # Change to AI Environment directory and run the script
-            result = subprocess.run([
-                sys.executable, str(script_path)
-            ], cwd=str(self.ai_env_path), capture_output=True, text=True)
+            returncode = self._run_streamed(script_path)
             
-            # Display output
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(f"{Fore.RED}{result.stderr}{Style.RESET_ALL}")
-            
-            if result.returncode == 0:
+            if returncode == 0:
                 self.print_success("Version check completed successfully")
                 return True
             else:
-                self.print_error(f"Version check failed (exit code: {result.returncode})")
+                self.print_error(f"Version check failed (exit code: {returncode})")
                 return False
                 
         except Exception as e:
@@ -451,7 +510,11 @@ class ActionHandlers:
         """Run update system to install new versions"""
         try:
             from ai_update_manager import UpdateManager
-            
+        except (ImportError, SyntaxError):  # its f-strings need Python 3.12+
+            self.print_error("Update manager not available")
+            return
+
+        try:
             self.print_info("Starting update system...")
             
             # Create update manager
@@ -472,8 +535,6 @@ class ActionHandlers:
             else:
                 self.print_info("No update selected or no updates available.")
                 
-        except ImportError:
-            self.print_error("Update manager not available")
         except Exception as e:
             self.print_error(f"Error running update system: {e}")
 
@@ -481,16 +542,20 @@ class ActionHandlers:
         """Handle AI2025 terminal launcher"""
         try:
             from ai_terminal_launcher import TerminalLauncher
-            
+        except ImportError:
+            self.print_error("Terminal launcher not available")
+            return
+
+        try:
             self.print_info("Launching AI2025 terminal...")
-            print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+            print(_EQ_SEP)
             print(f"{Fore.GREEN}🚀 Starting AI2025 Enhanced Terminal{Style.RESET_ALL}")
             print(f"{Fore.YELLOW}📋 Features:{Style.RESET_ALL}")
             print(f"   • AI2025 environment pre-activated")
             print(f"   • Custom prompt [AI2025-Terminal]")
             print(f"   • return_to_menu command available")
             print(f"   • All AI packages ready to use")
-            print(f"{Fore.CYAN}{'='*60}{Style.RESET_ALL}")
+            print(_EQ_SEP)
             
             # Create terminal launcher
             terminal_launcher = TerminalLauncher(self.ai_env_path)
@@ -503,65 +568,78 @@ class ActionHandlers:
             else:
                 self.print_error("Failed to launch AI2025 terminal")
                 
-        except ImportError:
-            self.print_error("Terminal launcher not available")
         except Exception as e:
             self.print_error(f"Error launching AI2025 terminal: {e}")
 
+    def _run_jupyter_lab_menu(self):
+        """Run the Jupyter Lab submenu from the launch menu"""
+        self.handle_jupyter_lab_menu()
+        return True  # Jupyter Lab menu handles its own success/error messages
+
     def handle_jupyter_lab_menu(self):
         """Handle Jupyter Lab submenu with full server management"""
-        from ai_jupyter_manager import JupyterLabManager
-        from ai_menu_system import MenuSystem
 
         # Create Jupyter Lab manager
-        jupyter_manager = JupyterLabManager(self.ai_env_path, self.venv_path)
-        menu = MenuSystem("3.0.28", "2025-08-12")
+        jupyter_manager = _lazy.JupyterLabManager(self.ai_env_path, self.venv_path)
+        menu = self._menu
+        
+        def stop_server():
+            jupyter_manager.stop_server()
+            # Flush input buffer to prevent hanging
+            sys.stdout.flush()
+            sys.stderr.flush()
+            time.sleep(0.1)  # Small delay to ensure processes are cleaned up
+        
+        actions = {
+            1: jupyter_manager.start_server_only,        # Start Server Only
+            2: jupyter_manager.start_client_only,        # Start Client Only
+            3: jupyter_manager.start_server_and_client,  # Start Server + Client
+            4: jupyter_manager.choose_custom_port,       # Choose Custom Port
+            5: jupyter_manager.check_server_status,      # Check Server Status
+            6: stop_server,                              # Stop Server
+        }
         
         while True:
             jupyter_manager.show_menu()
             
-            choice = menu.get_user_choice(6)
-            
-            if choice == 0:  # Back to applications menu
+            handler = actions.get(menu.get_user_choice(6))
+            if handler is None:  # Back to applications menu
                 break
-            elif choice == 1:  # Start Server Only
-                jupyter_manager.start_server_only()
-            elif choice == 2:  # Start Client Only
-                jupyter_manager.start_client_only()
-            elif choice == 3:  # Start Server + Client
-                jupyter_manager.start_server_and_client()
-            elif choice == 4:  # Choose Custom Port
-                jupyter_manager.choose_custom_port()
-            elif choice == 5:  # Check Server Status
-                jupyter_manager.check_server_status()
-            elif choice == 6:  # Stop Server
-                jupyter_manager.stop_server()
-                # Flush input buffer to prevent hanging
-                import sys
-                sys.stdout.flush()
-                sys.stderr.flush()
-                time.sleep(0.1)  # Small delay to ensure processes are cleaned up
-                
-            if choice != 0:
-                input(f"\n{Fore.YELLOW}Press Enter to continue...{Style.RESET_ALL}")
+            handler()
+            
+            self._wait_for_enter()
 
 def main():
     """Test action handlers"""
-    # Search for AI_Environment installation
+    # Search for AI_Environment installation, starting from the last one found
     import string
     ai_env_path = None
 
-    for letter in string.ascii_uppercase:
-        for possible_path in [Path(f"{letter}:\\AI_Lab\\AI_Environment"), Path(f"{letter}:\\AI_Environment")]:
-            if possible_path.exists():
-                ai_env_path = possible_path
-                break
-        if ai_env_path:
-            break
+    try:
+        cached = AI_ENV_CACHE_FILE.read_text(encoding='utf-8').strip()
+        if cached and os.path.isdir(cached):
+            ai_env_path = Path(cached)
+    except OSError:
+        pass
 
     if not ai_env_path:
-        print("AI_Environment not found on any drive!")
-        return
+        for letter in string.ascii_uppercase:
+            for possible_path in (f"{letter}:\\AI_Lab\\AI_Environment", f"{letter}:\\AI_Environment"):
+                if os.path.isdir(possible_path):
+                    ai_env_path = Path(possible_path)
+                    break
+            if ai_env_path:
+                break
+
+        if not ai_env_path:
+            print("AI_Environment not found on any drive!")
+            return
+
+        try:
+            AI_ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            AI_ENV_CACHE_FILE.write_text(str(ai_env_path), encoding='utf-8')
+        except OSError:
+            pass
 
     venv_path = ai_env_path / ".venv"
 
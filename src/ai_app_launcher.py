@@ -10,7 +10,8 @@ AI Environment - Application Launcher Module (Main Class)
 Handles launching various applications in background mode with enhanced VS Code integration
 """
 
-import subprocess
+import functools
+import sys
 import time
 import os
 from pathlib import Path
@@ -23,12 +24,34 @@ except ImportError:
     class Style:
         RESET_ALL = ""
 
-from ai_process_manager import BackgroundProcessManager
+from ai_process_manager import BackgroundProcessManager, spawn_detached
 from ai_vscode_config import VSCodeConfigManager
 from ai_app_launchers import AppLaunchers
 from ai_launcher_menu import LauncherMenu
 
+# Message prefixes never change, so build them once
+_INFO_PFX = f"{Fore.YELLOW}[INFO] "
+_OK_PFX = f"{Fore.GREEN}[OK] "
+_ERR_PFX = f"{Fore.RED}[ERROR] "
+_WARN_PFX = f"{Fore.YELLOW}[WARNING] "
+_SFX = Style.RESET_ALL
+
+# Shown after every successful VS Code launch
+_QUICK_START = (
+    f"{_INFO_PFX}🎯 Quick Start Guide:{_SFX}\n"
+    f"{_INFO_PFX}  1. Press Ctrl+` to open [AI2025-Terminal]{_SFX}\n"
+    f"{_INFO_PFX}  2. Press F5 to debug with AI2025 interpreter{_SFX}\n"
+    f"{_INFO_PFX}  3. Use Ctrl+Shift+P → 'Tasks: Run Task' for AI Environment tasks{_SFX}\n"
+    f"{_INFO_PFX}  4. Run 'python activate_ai_env.py' to access main menu{_SFX}\n"
+    f"{_OK_PFX}🚀 VS Code is ready with full AI Environment v3.0.26 integration!{_SFX}\n"
+)
+
+# Entries that identify an AI_Environment root
+_EXPECTED_ITEMS = frozenset(('src', 'Projects', 'activate_ai_env.py'))
+_AI_ENV_COMPONENT = os.sep + 'AI_Environment' + os.sep
+
 # Universal path detection - works regardless of installation location
+@functools.lru_cache(maxsize=1)
 def get_ai_environment_path():
     """
     Dynamically detect AI_Environment path based on script location.
@@ -41,46 +64,78 @@ def get_ai_environment_path():
     script_path = Path(__file__).resolve()
     ai_env_path = script_path.parent.parent
 
-    # Verify this is actually the AI_Environment directory
-    expected_items = ['src', 'Projects', 'activate_ai_env.py']
-    if all((ai_env_path / item).exists() for item in expected_items):
+    # Verify this is actually the AI_Environment directory; one directory
+    # listing answers for all expected entries at once
+    try:
+        with os.scandir(ai_env_path) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        names = set()
+    if _EXPECTED_ITEMS <= names:
         return ai_env_path
 
-    # Fallback: search for AI_Environment folder in path
-    if 'AI_Environment' in str(ai_env_path):
-        parts = ai_env_path.parts
-        for i, part in enumerate(parts):
-            if part == 'AI_Environment':
-                return Path(*parts[:i+1])
+    # Fallback: cut the path after its innermost AI_Environment component
+    path_str = str(ai_env_path) + os.sep
+    idx = path_str.rfind(_AI_ENV_COMPONENT)
+    if idx != -1:
+        return Path(path_str[:idx + len(_AI_ENV_COMPONENT) - 1])
 
     # Last resort: return calculated path
     return ai_env_path
 
+# VS Code executable locations, in search order
+_VSCODE_CANDIDATES = (
+    "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code",
+)
+
 class ApplicationLauncher:
     """Launches and manages various AI development applications"""
     
     def __init__(self, ai_env_path):
-        self.ai_env_path = Path(ai_env_path)
-        self.process_manager = BackgroundProcessManager(ai_env_path)
-        self.vscode_config = VSCodeConfigManager(ai_env_path)
-        self.app_launchers = AppLaunchers(ai_env_path, self.process_manager)
+        self.ai_env_path = ai_env_path if isinstance(ai_env_path, Path) else Path(ai_env_path)
+        self.process_manager = BackgroundProcessManager(self.ai_env_path)
+        self.vscode_config = VSCodeConfigManager(self.ai_env_path)
+        self.app_launchers = AppLaunchers(self.ai_env_path, self.process_manager)
         self.launcher_menu = LauncherMenu()
+        self._vscode_exe = None
+        self._configured_projects = set()
+        # Launch menu handlers, indexed by menu choice (0 is cancel)
+        self._handlers = (
+            None,
+            self.launch_vscode,
+            self.launch_jupyter,
+            self.launch_streamlit_demo,
+            self.launch_python_repl,
+            self.launch_conda_prompt,
+            self.launch_file_explorer,
+            self.launch_tensorboard,
+            self.launch_mlflow_ui,
+        )
         
     def print_info(self, message):
         """Print info message"""
-        print(f"{Fore.YELLOW}[INFO] {message}{Style.RESET_ALL}")
+        print(_INFO_PFX + message + _SFX)
         
     def print_success(self, message):
         """Print success message"""
-        print(f"{Fore.GREEN}[OK] {message}{Style.RESET_ALL}")
+        print(_OK_PFX + message + _SFX)
         
     def print_error(self, message):
         """Print error message"""
-        print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+        print(_ERR_PFX + message + _SFX)
         
     def print_warning(self, message):
         """Print warning message"""
-        print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
+        print(_WARN_PFX + message + _SFX)
+
+    def _find_vscode(self):
+        """Return the VS Code executable, probing only until it has been found"""
+        if self._vscode_exe is None:
+            for path in _VSCODE_CANDIDATES:
+                if os.path.exists(path):
+                    self._vscode_exe = Path(path)
+                    break
+        return self._vscode_exe
 
     def launch_vscode(self, project_path=None):
         """Enhanced VS Code launcher with AI Environment v3.0.26 integration"""
@@ -126,34 +181,26 @@ class ApplicationLauncher:
                 self.print_error("Invalid input")
                 return False
 
-        # Check for VS Code executable (try multiple locations)
-        vscode_paths = [
-            "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code",  # Portable in AI Environment
-            "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code".format(os.environ.get('USERNAME', '')),
-            "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code",
-            "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code"
-        ]
-        
-        vscode_exe = None
-        for path in vscode_paths:
-            if Path(path).exists():
-                vscode_exe = Path(path)
-                break
-        
+        # Check for VS Code executable (found once, then reused)
+        vscode_exe = self._find_vscode()
         if not vscode_exe:
             self.print_error("VS Code not found! Please install VS Code or update the path")
             self.print_info("Checked locations:")
-            for path in vscode_paths:
+            for path in _VSCODE_CANDIDATES:
                 self.print_info(f"  - {path}")
             return False
 
-        # Setup enhanced workspace configuration
-        self.vscode_config.create_enhanced_vscode_config(project_path)
-        
-        # Create enhanced main.py if it doesn't exist
         main_py = project_path / "main.py"
-        if not main_py.exists():
-            self.vscode_config.create_enhanced_main_py(main_py)
+        
+        # Workspace files are written once per project per session
+        if project_path not in self._configured_projects:
+            # Setup enhanced workspace configuration
+            self.vscode_config.create_enhanced_vscode_config(project_path)
+            
+            # Create enhanced main.py if it doesn't exist
+            if not main_py.exists():
+                self.vscode_config.create_enhanced_main_py(main_py)
+            self._configured_projects.add(project_path)
         
         # Prepare VS Code command with AI Environment integration
         cmd = [str(vscode_exe)]
@@ -169,38 +216,36 @@ class ApplicationLauncher:
         if main_py.exists():
             cmd.append(str(main_py))
             
-        self.print_info("Launching VS Code with enhanced AI Environment integration...")
-        self.print_info(f"✓ Project workspace: {project_path}")
-        self.print_info(f"✓ VS Code executable: {vscode_exe}")
-        self.print_info("✓ AI2025 interpreter configured")
-        self.print_info("✓ [AI2025-Terminal] profile ready")
-        self.print_info("✓ AI Environment system integration enabled")
+        # One write for the whole block instead of a print per line
+        sys.stdout.write(
+            f"{_INFO_PFX}Launching VS Code with enhanced AI Environment integration...{_SFX}\n"
+            f"{_INFO_PFX}✓ Project workspace: {project_path}{_SFX}\n"
+            f"{_INFO_PFX}✓ VS Code executable: {vscode_exe}{_SFX}\n"
+            f"{_INFO_PFX}✓ AI2025 interpreter configured{_SFX}\n"
+            f"{_INFO_PFX}✓ [AI2025-Terminal] profile ready{_SFX}\n"
+            f"{_INFO_PFX}✓ AI Environment system integration enabled{_SFX}\n"
+        )
+        sys.stdout.flush()
         
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                # macOS: no special creation flags needed
-            )
+            # Absolute executable, no cwd or preexec_fn: eligible for posix_spawn
+            pid = spawn_detached(cmd)
             
             # Track the process with enhanced information
             success = self.process_manager.track_process(
                 process_id=f"vscode_ai_env_{int(time.time())}",
                 name="VS Code (AI Environment)",
-                pid=process.pid,
-                command=' '.join(cmd),
+                pid=pid,
+                command=cmd,
                 url=None
             )
             
             if success:
-                self.print_success(f"VS Code launched successfully (PID: {process.pid})")
-                self.print_info("🎯 Quick Start Guide:")
-                self.print_info("  1. Press Ctrl+` to open [AI2025-Terminal]")
-                self.print_info("  2. Press F5 to debug with AI2025 interpreter")
-                self.print_info("  3. Use Ctrl+Shift+P → 'Tasks: Run Task' for AI Environment tasks")
-                self.print_info("  4. Run 'python activate_ai_env.py' to access main menu")
-                self.print_success("🚀 VS Code is ready with full AI Environment v3.0.26 integration!")
+                sys.stdout.write(
+                    f"{_OK_PFX}VS Code launched successfully (PID: {pid}){_SFX}\n"
+                    f"{_QUICK_START}"
+                )
+                sys.stdout.flush()
                 return True
             else:
                 self.print_error("Failed to track VS Code process")
@@ -245,30 +290,26 @@ class ApplicationLauncher:
         
     def handle_launch_choice(self, choice):
         """Handle application launch choice"""
-        if choice == 1:
-            return self.launch_vscode()
-        elif choice == 2:
-            return self.launch_jupyter()
-        elif choice == 3:
-            return self.launch_streamlit_demo()
-        elif choice == 4:
-            return self.launch_python_repl()
-        elif choice == 5:
-            return self.launch_conda_prompt()
-        elif choice == 6:
-            return self.launch_file_explorer()
-        elif choice == 7:
-            return self.launch_tensorboard()
-        elif choice == 8:
-            return self.launch_mlflow_ui()
-        else:
-            return False
+        handler = self._handlers[choice] if 0 < choice < len(self._handlers) else None
+        return handler() if handler else False
+
+@functools.lru_cache(maxsize=4)
+def _cached_application_launcher(ai_env_path):
+    return ApplicationLauncher(ai_env_path)
+
+def get_application_launcher(ai_env_path):
+    """Return the shared ApplicationLauncher for ai_env_path, built on first request"""
+    launcher = _cached_application_launcher(Path(ai_env_path))
+    # Other components track processes too, so pick up their entries before
+    # this launcher saves the tracking file again
+    launcher.process_manager.load_tracked_processes()
+    return launcher
 
 def main():
     """Test application launcher"""
     # Use dynamic path detection instead of hardcoded path
     ai_env_path = get_ai_environment_path()
-    app_launcher = ApplicationLauncher(ai_env_path)
+    app_launcher = get_application_launcher(ai_env_path)
     
     print("Testing Enhanced Application Launcher with AI Environment v3.0.26 integration...")
     app_launcher.show_launch_menu()
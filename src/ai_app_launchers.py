@@ -8,10 +8,22 @@ AI Environment - Individual Application Launchers (macOS Version)
 Handles launching of specific applications (Jupyter, Streamlit, etc.)
 """
 
+import os
+import select
+import shlex
+import shutil
+import socket
+import sys
+import threading
 import webbrowser
 import time
 from pathlib import Path
 
+try:
+    import termios
+except ImportError:
+    termios = None
+
 try:
     from colorama import Fore, Style
 except ImportError:
@@ -20,28 +32,41 @@ except ImportError:
     class Style:
         RESET_ALL = ""
 
+from ai_process_manager import spawn_detached
+
+# macOS launcher for apps, folders and URLs
+_OPEN = "/usr/bin/open"
+
+# Message prefixes never change, so build them once
+_INFO_PFX = f"{Fore.YELLOW}[INFO] "
+_OK_PFX = f"{Fore.GREEN}[OK] "
+_ERR_PFX = f"{Fore.RED}[ERROR] "
+_WARN_PFX = f"{Fore.YELLOW}[WARNING] "
+_SFX = Style.RESET_ALL
+
 class AppLaunchers:
     """Handles launching of individual applications on macOS"""
 
     def __init__(self, ai_env_path, process_manager):
-        self.ai_env_path = Path(ai_env_path)
+        self.ai_env_path = ai_env_path if isinstance(ai_env_path, Path) else Path(ai_env_path)
         self.process_manager = process_manager
+        self._conda_exe = None
 
     def print_info(self, message):
         """Print info message"""
-        print(f"{Fore.YELLOW}[INFO] {message}{Style.RESET_ALL}")
+        print(_INFO_PFX + message + _SFX)
 
     def print_success(self, message):
         """Print success message"""
-        print(f"{Fore.GREEN}[OK] {message}{Style.RESET_ALL}")
+        print(_OK_PFX + message + _SFX)
 
     def print_error(self, message):
         """Print error message"""
-        print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+        print(_ERR_PFX + message + _SFX)
 
     def print_warning(self, message):
         """Print warning message"""
-        print(f"{Fore.YELLOW}[WARNING] {message}{Style.RESET_ALL}")
+        print(_WARN_PFX + message + _SFX)
 
     def launch_jupyter(self):
         """Launch Jupyter Lab"""
@@ -54,11 +79,9 @@ class AppLaunchers:
 
             # Ask if user wants to open browser
             try:
-                open_browser = input(f"\n{Fore.CYAN}Open Jupyter Lab in browser? (y/n): {Style.RESET_ALL}").lower()
-                if open_browser in ['y', 'yes']:
-                    time.sleep(3)  # Wait for server to start
-                    webbrowser.open('http://localhost:8888')
-                    self.print_success("Jupyter Lab opened in browser")
+                if self._prompt_yes("Open Jupyter Lab in browser?"):
+                    self._open_browser_when_ready(8888, 'http://localhost:8888')
+                    self.print_success("Jupyter Lab will open in browser once the server is ready")
             except:
                 pass
 
@@ -75,30 +98,12 @@ class AppLaunchers:
 
             # Ask if user wants to open browser
             try:
-                open_browser = input(f"\n{Fore.CYAN}Open Streamlit demo in browser? (y/n): {Style.RESET_ALL}").lower().strip()
-                if open_browser in ['y', 'yes']:
-                    self.print_info("Waiting for Streamlit server to initialize...")
-                    # Wait longer for Streamlit to start (it's slower than Jupyter)
-                    max_wait = 15
-                    port_found = False
-                    for i in range(max_wait):
-                        time.sleep(1)
-                        if self._is_port_in_use(8501):
-                            port_found = True
-                            # Give it 2 more seconds after port opens for app to fully initialize
-                            self.print_info("Server responding, finalizing startup...")
-                            time.sleep(2)
-                            break
-                        if i % 2 == 0:
-                            print(f"{Fore.YELLOW}.{Style.RESET_ALL}", end="", flush=True)
-                    print()  # New line after dots
-
-                    if not port_found:
-                        self.print_warning("Server took longer than expected to start")
-                        self.print_info("Opening browser anyway - you may need to refresh")
-
-                    webbrowser.open('http://localhost:8501')
-                    self.print_success("Streamlit demo opened in browser")
+                if self._prompt_yes("Open Streamlit demo in browser?"):
+                    # Streamlit is slower than Jupyter to start, and the app needs
+                    # 2 more seconds after the port opens to fully initialize
+                    self._open_browser_when_ready(8501, 'http://localhost:8501', max_wait=15, settle=2)
+                    self.print_success("Streamlit demo will open in browser once the server is ready")
+                    self.print_info("If the page is blank, refresh it after a few seconds")
             except KeyboardInterrupt:
                 self.print_info("Browser launch cancelled")
             except Exception as e:
@@ -106,33 +111,95 @@ class AppLaunchers:
 
         return success
 
+    def _prompt_yes(self, question, timeout=10, default=True):
+        """Ask a y/n question, answering default if nothing is typed within timeout seconds"""
+        hint = "Y/n" if default else "y/N"
+        sys.stdout.write(f"\n{Fore.CYAN}{question} ({hint}, {timeout}s): {Style.RESET_ALL}")
+        sys.stdout.flush()
+        try:
+            # select() only works on a terminal here (not on Windows consoles or
+            # most IDE consoles); anywhere else just wait for the answer
+            if not sys.stdin.isatty():
+                raise OSError("stdin is not a terminal")
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        except (OSError, ValueError):
+            answer = input().strip().lower()
+        else:
+            if not ready:
+                # Drop a half-typed answer so it doesn't reach the next prompt
+                if termios is not None:
+                    try:
+                        termios.tcflush(sys.stdin, termios.TCIFLUSH)
+                    except termios.error:
+                        pass
+                sys.stdout.write("\n")
+                return default
+            answer = sys.stdin.readline().strip().lower()
+        if not answer:
+            return default
+        return answer in ('y', 'yes')
+
     def _is_port_in_use(self, port):
         """Check if a port is in use"""
-        import socket
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            return s.connect_ex(('localhost', port)) == 0
+            # Bounded probe on the loopback literal: no DNS lookup, no long stall
+            s.settimeout(0.05)
+            return s.connect_ex(('127.0.0.1', port)) == 0
+
+    def _wait_for_port(self, port, max_wait=10):
+        """Poll until a server accepts connections on port; returns False on timeout"""
+        deadline = time.monotonic() + max_wait
+        while not self._is_port_in_use(port):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def _open_url(self, url):
+        """Open url in the default browser by spawning open directly"""
+        try:
+            spawn_detached([_OPEN, '-u', url])
+        except OSError:
+            # No /usr/bin/open (not macOS): let webbrowser find a browser
+            webbrowser.open(url)
+
+    def _open_browser_when_ready(self, port, url, max_wait=10, settle=0):
+        """Open url from a background thread once port answers, so the menu isn't blocked"""
+        def open_when_ready():
+            if self._wait_for_port(port, max_wait) and settle:
+                time.sleep(settle)
+            self._open_url(url)
+
+        threading.Thread(target=open_when_ready, daemon=True).start()
+
+    def _write_launch_script(self, name, command):
+        """Write an executable Terminal launch script under .cache, only when it changed"""
+        script = self.ai_env_path / ".cache" / name
+        body = f"#!/bin/bash\n{command}\n"
+        try:
+            if script.read_text(encoding='utf-8') == body:
+                return script
+        except OSError:
+            script.parent.mkdir(parents=True, exist_ok=True)
+        script.write_text(body, encoding='utf-8')
+        script.chmod(0o755)
+        return script
 
     def launch_python_repl(self):
         """Launch Python REPL in new terminal on macOS"""
         print(f"\n{Fore.BLUE}🐍 Launching Python REPL...{Style.RESET_ALL}")
 
         try:
-            # Launch Python in a new Terminal window using osascript
-            osascript_cmd = f'''
-tell application "Terminal"
-    do script "cd '{self.ai_env_path}' && source '{self.ai_env_path}/Miniconda/bin/activate' AI2025 && python"
-    activate
-end tell
-'''
-
-            import subprocess
-            process = subprocess.Popen(
-                ['osascript', '-e', osascript_cmd],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+            # Launch Python in a new Terminal window from a cached launch script
+            activate = self.ai_env_path / "Miniconda" / "bin" / "activate"
+            script = self._write_launch_script(
+                "launch_repl.sh",
+                f"cd {shlex.quote(str(self.ai_env_path))} && "
+                f"source {shlex.quote(str(activate))} AI2025 && exec python"
             )
+            pid = spawn_detached([_OPEN, '-na', 'Terminal.app', str(script)])
 
-            if process:
+            if pid:
                 self.print_success("Python REPL launched in new terminal window")
                 self.print_info("Use 'Background Processes' menu to manage it")
                 return True
@@ -143,55 +210,53 @@ end tell
             self.print_error(f"Failed to launch Python REPL: {e}")
             return False
 
+    def _conda_locations(self):
+        """Candidate conda executables, in search order"""
+        return (
+            self.ai_env_path / "Miniconda" / "bin" / "conda",
+            Path.home() / "miniconda3" / "bin" / "conda",
+            Path.home() / "anaconda3" / "bin" / "conda",
+            Path("/opt/miniconda3/bin/conda"),
+        )
+
+    def _find_conda(self):
+        """Return the conda executable, probing only until it has been found"""
+        if self._conda_exe is None:
+            for location in self._conda_locations():
+                if os.path.exists(location):
+                    self._conda_exe = location
+                    break
+            else:
+                conda_in_path = shutil.which("conda")
+                if conda_in_path:
+                    self._conda_exe = Path(conda_in_path)
+        return self._conda_exe
+
     def launch_conda_prompt(self):
         """Launch Conda prompt in new terminal on macOS"""
         print(f"\n{Fore.BLUE}🔧 Launching Conda Prompt...{Style.RESET_ALL}")
 
         try:
             # Find conda executable - check multiple locations for macOS
-            from ai_path_finder import find_conda
-            conda_exe = find_conda()
-
-            if not conda_exe:
-                conda_locations = [
-                    self.ai_env_path / "Miniconda" / "bin" / "conda",
-                    Path.home() / "miniconda3" / "bin" / "conda",
-                    Path.home() / "anaconda3" / "bin" / "conda",
-                    Path("/opt/miniconda3/bin/conda"),
-                ]
-
-                for location in conda_locations:
-                    if location.exists():
-                        conda_exe = location
-                        break
-
+            conda_exe = self._find_conda()
             if not conda_exe:
                 self.print_error("Conda executable not found!")
                 self.print_info("Checked locations:")
-                for loc in [
-                    self.ai_env_path / "Miniconda" / "bin" / "conda",
-                    Path.home() / "miniconda3" / "bin" / "conda",
-                    Path.home() / "anaconda3" / "bin" / "conda",
-                ]:
+                for loc in self._conda_locations():
                     self.print_info(f"  - {loc}")
                 return False
 
-            # Activate conda environment and open prompt using Terminal.app
-            osascript_cmd = f'''
-tell application "Terminal"
-    do script "cd '{self.ai_env_path}' && source '{conda_exe.parent.parent}/bin/activate' AI2025"
-    activate
-end tell
-'''
-
-            import subprocess
-            process = subprocess.Popen(
-                ['osascript', '-e', osascript_cmd],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+            # Activate conda environment and open prompt using Terminal.app;
+            # the interactive shell inherits the activated environment
+            activate = Path(conda_exe).parent.parent / "bin" / "activate"
+            script = self._write_launch_script(
+                "launch_conda.sh",
+                f"cd {shlex.quote(str(self.ai_env_path))} && "
+                f"source {shlex.quote(str(activate))} AI2025 && exec \"${{SHELL:-/bin/zsh}}\" -i"
             )
+            pid = spawn_detached([_OPEN, '-na', 'Terminal.app', str(script)])
 
-            if process:
+            if pid:
                 self.print_success("Conda prompt launched in new terminal window")
                 self.print_info("Use 'Background Processes' menu to manage it")
                 return True
@@ -207,19 +272,11 @@ end tell
         print(f"\n{Fore.BLUE}📁 Opening Finder...{Style.RESET_ALL}")
 
         try:
-            import subprocess
-            cmd = ['open', str(self.ai_env_path)]
-
-            success = self.process_manager.launch_custom_command(
-                ' '.join(cmd),
-                "Finder",
-                self.ai_env_path
-            )
-
-            if success:
-                self.print_success("Finder opened")
-                self.print_info("Use 'Background Processes' menu to manage it")
-            return success
+            # open hands the folder to Finder and exits, so there is no
+            # long-running process to track
+            spawn_detached([_OPEN, str(self.ai_env_path)])
+            self.print_success("Finder opened")
+            return True
 
         except Exception as e:
             self.print_error(f"Failed to open Finder: {e}")
@@ -234,7 +291,7 @@ end tell
             log_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            cmd = f'tensorboard --logdir="{log_dir}" --port=6006'
+            cmd = ['tensorboard', f'--logdir={log_dir}', '--port=6006']
 
             success = self.process_manager.launch_custom_command(
                 cmd,
@@ -249,11 +306,9 @@ end tell
 
                 # Ask if user wants to open browser
                 try:
-                    open_browser = input(f"\n{Fore.CYAN}Open TensorBoard in browser? (y/n): {Style.RESET_ALL}").lower()
-                    if open_browser in ['y', 'yes']:
-                        time.sleep(3)  # Wait for server to start
-                        webbrowser.open('http://localhost:6006')
-                        self.print_success("TensorBoard opened in browser")
+                    if self._prompt_yes("Open TensorBoard in browser?"):
+                        self._open_browser_when_ready(6006, 'http://localhost:6006')
+                        self.print_success("TensorBoard will open in browser once the server is ready")
                 except:
                     pass
 
@@ -272,7 +327,7 @@ end tell
             mlflow_dir = self.ai_env_path / "Projects" / "mlruns"
             mlflow_dir.mkdir(parents=True, exist_ok=True)
 
-            cmd = f'mlflow ui --backend-store-uri "file:///{mlflow_dir}" --port=5000'
+            cmd = ['mlflow', 'ui', '--backend-store-uri', f'file:///{mlflow_dir}', '--port=5000']
 
             success = self.process_manager.launch_custom_command(
                 cmd,
@@ -287,11 +342,9 @@ end tell
 
                 # Ask if user wants to open browser
                 try:
-                    open_browser = input(f"\n{Fore.CYAN}Open MLflow UI in browser? (y/n): {Style.RESET_ALL}").lower()
-                    if open_browser in ['y', 'yes']:
-                        time.sleep(3)  # Wait for server to start
-                        webbrowser.open('http://localhost:5000')
-                        self.print_success("MLflow UI opened in browser")
+                    if self._prompt_yes("Open MLflow UI in browser?"):
+                        self._open_browser_when_ready(5000, 'http://localhost:5000')
+                        self.print_success("MLflow UI will open in browser once the server is ready")
                 except:
                     pass
 
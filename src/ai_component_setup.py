@@ -11,9 +11,22 @@ AI Environment - Component Setup Module
 Handles Flask, Ollama, and other component setup
 """
 
+import json
+import os
+import socket
+import string
 import subprocess
+import sys
+import tempfile
+import time
 from pathlib import Path
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 try:
     from colorama import Fore, Style
 except ImportError:
@@ -22,6 +35,96 @@ except ImportError:
     class Style:
         RESET_ALL = ""
 
+# Windows: start console programs without opening a console window (0 elsewhere)
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Where main() remembers the AI_Environment it found last time (shared with
+# ai_action_handlers.main())
+AI_ENV_CACHE_FILE = Path.home() / ".cache" / "ai_env" / "ai_env_path"
+
+# Drive letters main() found no AI_Environment on, valid while the set of
+# present drives is unchanged and the entry is younger than a day
+_NEGATIVE_DRIVES_FILE = Path(tempfile.gettempdir()) / "ai_env_negative_drives.json"
+_NEGATIVE_DRIVES_TTL = 24 * 60 * 60
+
+def _logical_drives():
+    """Return (drive bitmask, present drive letters); the mask is None where it can't be asked"""
+    try:
+        import ctypes
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+    except (ImportError, AttributeError, OSError):
+        return None, string.ascii_uppercase
+    return mask, [letter for i, letter in enumerate(string.ascii_uppercase) if mask & (1 << i)]
+
+def _load_negative_drives(mask):
+    """Drive letters known not to hold AI_Environment for this drive mask"""
+    if mask is None:
+        return set()
+    try:
+        data = json.loads(_NEGATIVE_DRIVES_FILE.read_text(encoding='utf-8'))
+        if data["mask"] == mask and time.time() - data["saved_at"] < _NEGATIVE_DRIVES_TTL:
+            return set(data["letters"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return set()
+
+def _save_negative_drives(mask, letters):
+    """Remember letters that held no AI_Environment, keyed by drive mask"""
+    if mask is None:
+        return
+    try:
+        _NEGATIVE_DRIVES_FILE.write_text(
+            json.dumps({"mask": mask, "saved_at": time.time(), "letters": sorted(letters)}),
+            encoding='utf-8'
+        )
+    except OSError:
+        pass
+
+def _list_directory(path):
+    """Map entry names in path to whether each is a directory; {} if unreadable"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+def _has_entries(path):
+    """True if directory path exists and contains at least one entry"""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+# Models directory found for each candidate list, reused while it still exists
+_models_directories = {}
+
+def _find_models_directory(possible_paths):
+    """Pick the Ollama models directory from candidates in priority order; None if none exists"""
+    cached = _models_directories.get(possible_paths)
+    if cached is not None and os.path.isdir(cached):
+        return cached
+
+    # List each distinct parent once instead of stat-ing every candidate
+    listings = {}
+    for path in possible_paths:
+        if path.parent not in listings:
+            listings[path.parent] = _list_directory(path.parent)
+    existing = [path for path in possible_paths if listings[path.parent].get(path.name)]
+
+    for path in existing:
+        # Verify this directory actually contains models by checking for blobs
+        if _has_entries(path / "blobs"):
+            # Only a directory holding models is remembered; an empty pick may
+            # lose to one that gets models later
+            _models_directories[possible_paths] = path
+            return path
+
+    # If no existing directory with models found, check for any existing empty directories
+    if existing:
+        return existing[0]
+    return None
+
 class ComponentSetup:
     """Manages component setup for AI Environment"""
 
@@ -31,6 +134,12 @@ class ComponentSetup:
         if ollama_path is None:
             ollama_path = Path(ai_env_path) / "Ollama" / "ollama.exe"
         self.ollama_exe = Path(ollama_path)
+        # Models directory candidates depend only on ai_env_path, in priority order
+        self._model_candidates = (
+            self.ai_env_path / "AI_Environment" / "Models",        # Inside AI_Environment subfolder (check first)
+            self.ai_env_path / "Models",                           # Direct in AI_Lab
+            self.ai_env_path.parent / "AI_Environment" / "Models", # Sibling directory
+        )
 
     def find_models_directory(self):
         """Find Ollama models directory using multiple detection methods
@@ -38,29 +147,12 @@ class ComponentSetup:
         Returns:
             Path: Path to models directory, or None if not found
         """
-        # Check multiple possible locations in priority order
-        possible_paths = [
-            self.ai_env_path / "AI_Environment" / "Models",        # Inside AI_Environment subfolder (check first)
-            self.ai_env_path / "Models",                           # Direct in AI_Lab
-            self.ai_env_path.parent / "AI_Environment" / "Models", # Sibling directory
-        ]
-
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                # Verify this directory actually contains models by checking for blobs
-                blobs_dir = path / "blobs"
-                if blobs_dir.exists() and any(blobs_dir.iterdir()):
-                    return path
-
-        # If no existing directory with models found, check for any existing empty directories
-        for path in possible_paths:
-            if path.exists() and path.is_dir():
-                return path
-
-        # If no existing directory found, create in AI_Environment subfolder
-        default_path = self.ai_env_path / "AI_Environment" / "Models"
-        default_path.mkdir(parents=True, exist_ok=True)
-        return default_path
+        models_path = _find_models_directory(self._model_candidates)
+        if models_path is None:
+            # If no existing directory found, create in AI_Environment subfolder
+            models_path = self._model_candidates[0]
+            models_path.mkdir(parents=True, exist_ok=True)
+        return models_path
         
     def print_info(self, message):
         """Print info message"""
@@ -78,10 +170,15 @@ class ComponentSetup:
         """Setup Flask package"""
         try:
             # Check if Flask is already installed
-            result = subprocess.run(['python', '-c', 'import flask; print(flask.__version__)'], 
+            # The running interpreter is the AI2025 one; no PATH lookup needed.
+            # Absolute executables and close_fds=False let subprocess use
+            # posix_spawn instead of fork+exec
+            result = subprocess.run([sys.executable, '-c', 'import flask; print(flask.__version__)'], 
                                   capture_output=True, 
                                   text=True, 
-                                  timeout=10)
+                                  timeout=10,
+                                  close_fds=False,
+                                  creationflags=_NO_WINDOW)
             
             if result.returncode == 0:
                 version = result.stdout.strip()
@@ -89,10 +186,12 @@ class ComponentSetup:
                 return True
             else:
                 self.print_info("Flask not found. Installing...")
-                result = subprocess.run(['pip', 'install', 'flask'], 
+                result = subprocess.run([sys.executable, '-m', 'pip', 'install', 'flask'], 
                                       capture_output=True, 
                                       text=True, 
-                                      timeout=60)
+                                      timeout=60,
+                                      close_fds=False,
+                                      creationflags=_NO_WINDOW)
                 
                 if result.returncode == 0:
                     self.print_success("Flask installed successfully")
@@ -105,6 +204,38 @@ class ComponentSetup:
             self.print_error(f"Flask setup error: {e}")
             return False
             
+    def _is_ollama_running(self):
+        """Check for a running Ollama process by executable name"""
+        image_name = self.ollama_exe.name.lower()
+        if PSUTIL_AVAILABLE:
+            # Reads the process table in-process instead of spawning tasklist
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if name and name.lower() == image_name:
+                    return True
+            return False
+
+        result = subprocess.run(['tasklist', '/FI', f'IMAGENAME eq {self.ollama_exe.name}'],
+                              capture_output=True,
+                              text=True,
+                              timeout=10,
+                              close_fds=False,
+                              creationflags=_NO_WINDOW)
+        return image_name in result.stdout.lower()
+
+    def _wait_for_ollama(self, process, max_wait=10):
+        """Poll the Ollama port until it accepts connections; False if process exits or time runs out"""
+        deadline = time.monotonic() + max_wait
+        while process.poll() is None:
+            try:
+                socket.create_connection(("127.0.0.1", 11434), timeout=0.1).close()
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.05)
+        return False
+
     def setup_ollama(self):
         """Setup Ollama server"""
         try:
@@ -113,12 +244,7 @@ class ComponentSetup:
                 return False
 
             # Check if Ollama is already running
-            result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq ollama.exe'],
-                                  capture_output=True,
-                                  text=True,
-                                  timeout=10)
-
-            if 'ollama.exe' in result.stdout:
+            if self._is_ollama_running():
                 self.print_success("Ollama server is already running")
                 return True
             else:
@@ -129,14 +255,15 @@ class ComponentSetup:
                 self.print_info(f"Using models directory: {models_path}")
 
                 # Prepare environment with OLLAMA_MODELS variable
-                import os
-                env = os.environ.copy()
-                env['OLLAMA_MODELS'] = str(models_path)
+                env = {**os.environ, 'OLLAMA_MODELS': str(models_path)}
 
                 process = subprocess.Popen(
                     [str(self.ollama_exe), 'serve'],
                     env=env,
-                    creationflags=subprocess.CREATE_NEW_CONSOLE
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
+                    creationflags=_NO_WINDOW
                 )
                 
                 # Track the process
@@ -153,16 +280,8 @@ class ComponentSetup:
                 except Exception as e:
                     self.print_warning(f"Could not track Ollama process: {e}")
                 
-                # Wait and verify
-                import time
-                time.sleep(3)
-                
-                result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq ollama.exe'], 
-                                      capture_output=True, 
-                                      text=True, 
-                                      timeout=10)
-                
-                if 'ollama.exe' in result.stdout:
+                # Wait until the server accepts connections
+                if self._wait_for_ollama(process):
                     self.print_success("Ollama server started successfully")
                     return True
                 else:
@@ -193,20 +312,44 @@ class ComponentSetup:
 def main():
     """Test component setup"""
     # Search for AI_Environment installation
-    import string
     ai_env_path = None
 
-    for letter in string.ascii_uppercase:
-        for possible_path in [Path(f"{letter}:\\AI_Lab\\AI_Environment"), Path(f"{letter}:\\AI_Environment")]:
-            if possible_path.exists():
-                ai_env_path = possible_path
-                break
-        if ai_env_path:
-            break
+    try:
+        cached = AI_ENV_CACHE_FILE.read_text(encoding='utf-8').strip()
+        if cached and os.path.isdir(cached):
+            ai_env_path = Path(cached)
+    except OSError:
+        pass
 
     if not ai_env_path:
-        print("AI_Environment not found on any drive!")
-        return
+        # Only probe drives that exist, and those empty last time only after
+        # every other drive missed (AI_Environment may have moved onto one);
+        # absent drive letters can stall each lookup
+        mask, letters = _logical_drives()
+        empty_drives = _load_negative_drives(mask)
+        ordered = [letter for letter in letters if letter not in empty_drives]
+        ordered += [letter for letter in letters if letter in empty_drives]
+        misses = set(empty_drives)
+        for letter in ordered:
+            for possible_path in [Path(f"{letter}:\\AI_Lab\\AI_Environment"), Path(f"{letter}:\\AI_Environment")]:
+                if possible_path.exists():
+                    ai_env_path = possible_path
+                    break
+            if ai_env_path:
+                misses.discard(letter)
+                break
+            misses.add(letter)
+        _save_negative_drives(mask, misses)
+
+        if not ai_env_path:
+            print("AI_Environment not found on any drive!")
+            return
+
+        try:
+            AI_ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            AI_ENV_CACHE_FILE.write_text(str(ai_env_path), encoding='utf-8')
+        except OSError:
+            pass
 
     component_setup = ComponentSetup(ai_env_path)
 
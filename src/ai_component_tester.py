@@ -12,10 +12,18 @@ AI Environment - Component Testing Module
 Comprehensive testing of all AI Environment components including model management and Jupyter Lab system
 """
 
+import importlib
+import importlib.machinery
+import importlib.util
+import io
 import os
 import re
+import shutil
+import stat
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 try:
     from colorama import Fore, Style
@@ -25,8 +33,56 @@ except ImportError:
     class Style:
         RESET_ALL = ""
 
-from ai_path_manager import PathManager
-from ai_uv_manager import UVManager
+# Message prefixes never change, so build them once; each message is a
+# single write() instead of print()'s separate text and newline writes
+_STEP_PFX = f"{Fore.CYAN}[*] Step "
+_STEP_SEP = f"{Fore.CYAN}{'-' * 50}{Style.RESET_ALL}\n"
+_OK_PFX = f"{Fore.GREEN}[OK] "
+_ERR_PFX = f"{Fore.RED}[ERROR] "
+_INFO_PFX = f"{Fore.YELLOW}[INFO] "
+_SFX = Style.RESET_ALL
+_EOL = Style.RESET_ALL + "\n"
+
+# Imports each package named in argv in one interpreter, reporting one line per package
+_IMPORT_PROBE = """
+import sys
+for name in sys.argv[1:]:
+    try:
+        __import__(name)
+        print("OK", name, flush=True)
+    except Exception:
+        print("FAIL", name, flush=True)
+"""
+
+# Import time budget per package; packages not listed get 5 seconds
+_IMPORT_TIMEOUTS = {"numpy": 10, "pandas": 15}
+
+class _ThreadedStdout:
+    """Stand-in for sys.stdout that keeps each worker thread's output separate"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._buffers = {}
+
+    def write(self, text):
+        return self._buffers.get(threading.get_ident(), self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def run_captured(self, test):
+        """Run test; returns (result, everything it printed)"""
+        buffer = io.StringIO()
+        ident = threading.get_ident()
+        self._buffers[ident] = buffer
+        try:
+            result = test()
+        finally:
+            del self._buffers[ident]
+        return result, buffer.getvalue()
 
 class ComponentTester:
     """Comprehensive testing of AI Environment components"""
@@ -34,33 +90,95 @@ class ComponentTester:
     def __init__(self, ai_env_path, venv_path):
         self.ai_env_path = Path(ai_env_path)
         self.venv_path = Path(venv_path)
+        # stat() results by path, shared by all tests; None means missing
+        self._stat_cache = {}
+        # Finds AI Environment modules in src/ without walking all of sys.path
+        self._src_dir = str(self.ai_env_path / "src")
+        self._src_finder = importlib.machinery.FileFinder(
+            self._src_dir,
+            (importlib.machinery.SourceFileLoader, importlib.machinery.SOURCE_SUFFIXES)
+        )
+        self._import_lock = threading.Lock()
+        # Absolute interpreter path, resolved once so each subprocess skips the
+        # PATH search; not resolve()d, since following the venv symlink would
+        # start the base interpreter outside the venv
+        venv_python = self.venv_path.absolute() / "bin" / "python"
+        if self._exists(venv_python):
+            self.python_exe = str(venv_python)
+        else:
+            self.python_exe = shutil.which("python") or sys.executable
         
+    def _stat(self, path):
+        """Return os.stat(path), or None if it doesn't exist, stat-ing each path only once"""
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            pass
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        self._stat_cache[path] = st
+        return st
+
+    def _exists(self, path):
+        """Cached equivalent of path.exists()"""
+        return self._stat(path) is not None
+
+    def _is_dir(self, path):
+        """Cached equivalent of path.is_dir(), answered from the same stat() as _exists"""
+        st = self._stat(path)
+        return st is not None and stat.S_ISDIR(st.st_mode)
+
+    def _import_from_src(self, module_name, name):
+        """Equivalent of 'from module_name import name', loading module_name from src/ directly"""
+        with self._import_lock:
+            # src modules import each other, so src must still be importable
+            if self._src_dir not in sys.path:
+                sys.path.append(self._src_dir)
+
+            module = sys.modules.get(module_name)
+            if module is None:
+                spec = self._src_finder.find_spec(module_name)
+                if spec is None:
+                    raise ImportError(f"No module named '{module_name}' in {self._src_dir}")
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    del sys.modules[module_name]
+                    raise
+
+        try:
+            return getattr(module, name)
+        except AttributeError:
+            raise ImportError(f"cannot import name '{name}' from '{module_name}'") from None
+
     def print_step(self, step_num, description):
         """Print step header"""
-        print(f"{Fore.CYAN}[*] Step {step_num}: {description}...{Style.RESET_ALL}")
-        separator = "-" * 50
-        print(f"{Fore.CYAN}{separator}{Style.RESET_ALL}")
+        sys.stdout.write(f"{_STEP_PFX}{step_num}: {description}...{_SFX}\n{_STEP_SEP}")
         
     def print_success(self, message):
         """Print success message"""
-        print(f"{Fore.GREEN}[OK] {message}{Style.RESET_ALL}")
+        sys.stdout.write(_OK_PFX + message + _EOL)
         
     def print_error(self, message):
         """Print error message"""
-        print(f"{Fore.RED}[ERROR] {message}{Style.RESET_ALL}")
+        sys.stdout.write(_ERR_PFX + message + _EOL)
         
     def print_info(self, message):
         """Print info message"""
-        print(f"{Fore.YELLOW}[INFO] {message}{Style.RESET_ALL}")
+        sys.stdout.write(_INFO_PFX + message + _EOL)
         
     def test_directory_structure(self):
         """Test AI Environment directory structure"""
-        if self.ai_env_path.exists():
+        if self._is_dir(self.ai_env_path):
             self.print_success("AI Environment directory found")
 
             # Check for UV virtual environment (required)
             venv_found = False
-            if self.venv_path.exists():
+            if self._is_dir(self.venv_path):
                 self.print_success(f"  ✓ UV virtual environment found at: {self.venv_path}")
                 venv_found = True
             else:
@@ -68,17 +186,17 @@ class ComponentTester:
 
             # Check for Ollama (optional) - check multiple locations
             ollama_found = False
-            if (self.ai_env_path / "Ollama").exists():
+            if self._is_dir(self.ai_env_path / "Ollama"):
                 self.print_success(f"  ✓ Ollama directory found (portable)")
                 ollama_found = True
-            elif (self.ai_env_path / "AI_Environment" / "Ollama").exists():
+            elif self._is_dir(self.ai_env_path / "AI_Environment" / "Ollama"):
                 self.print_success(f"  ✓ Ollama directory found (in AI_Environment subfolder)")
                 ollama_found = True
             else:
                 self.print_info(f"  - Ollama directory not found (optional)")
 
             # Check other optional directories
-            if (self.ai_env_path / "AI_Installer").exists():
+            if self._is_dir(self.ai_env_path / "AI_Installer"):
                 self.print_success(f"  ✓ AI_Installer directory found (optional)")
             else:
                 self.print_info(f"  - AI_Installer directory not found (optional)")
@@ -96,9 +214,10 @@ class ComponentTester:
     def test_uv_installation(self):
         """Test UV installation"""
         try:
-            # Test UV command
-            result = subprocess.run(["uv", "--version"],
-                                  capture_output=True, text=True, timeout=10)
+            # Test UV command; an absolute executable and close_fds=False let
+            # subprocess start it with posix_spawn instead of fork+exec
+            result = subprocess.run([shutil.which("uv") or "uv", "--version"],
+                                  capture_output=True, text=True, timeout=10, close_fds=False)
             if result.returncode == 0:
                 version = result.stdout.strip()
                 self.print_success(f"  ✓ UV version: {version}")
@@ -119,18 +238,18 @@ class ComponentTester:
             
     def test_venv_environment(self):
         """Test UV virtual environment"""
-        if self.venv_path.exists():
+        if self._is_dir(self.venv_path):
             self.print_success("UV virtual environment directory found")
 
             # Test Python executable
             python_exe = self.venv_path / "bin" / "python"
-            if python_exe.exists():
+            if self._exists(python_exe):
                 self.print_success("  ✓ Python executable found")
 
                 # Test Python version
                 try:
                     result = subprocess.run([str(python_exe), "--version"],
-                                          capture_output=True, text=True, timeout=10)
+                                          capture_output=True, text=True, timeout=10, close_fds=False)
                     if result.returncode == 0:
                         version = result.stdout.strip()
                         self.print_success(f"  ✓ Python version: {version}")
@@ -152,41 +271,91 @@ class ComponentTester:
             self.print_error("UV virtual environment not found")
             return False
             
+    def _running_in_venv(self):
+        """True if this interpreter is the one from the venv under test"""
+        try:
+            return Path(sys.prefix).resolve() == self.venv_path.resolve()
+        except OSError:
+            return False
+
+    def _import_statuses_in_process(self, packages):
+        """Settle packages without importing them here; returns ({package: "OK"|"FAIL"}, packages left to probe)"""
+        # Real imports stay in the timed child probe: a hanging or crashing
+        # import must fail one check, not take the menu process down
+        statuses = {}
+        to_probe = []
+        for package in packages:
+            if package in sys.modules:
+                statuses[package] = "OK"
+                continue
+            try:
+                found = importlib.util.find_spec(package) is not None
+            except (ImportError, ValueError):
+                found = False
+            if found:
+                to_probe.append(package)
+            else:
+                statuses[package] = "FAIL"
+        return statuses, to_probe
+
+    def _import_statuses_subprocess(self, packages):
+        """Import packages in a child python; returns ({package: "OK"|"FAIL"}, error)"""
+        # One interpreter start-up for all packages instead of one each
+        timeout_duration = sum(_IMPORT_TIMEOUTS.get(package, 5) for package in packages)
+        error = None
+        try:
+            result = subprocess.run([self.python_exe, "-c", _IMPORT_PROBE, *packages],
+                                  capture_output=True, text=True, timeout=timeout_duration, close_fds=False)
+            output = result.stdout
+        except subprocess.TimeoutExpired as e:
+            output = e.stdout or ""
+            if isinstance(output, bytes):
+                output = output.decode(errors="replace")
+            error = f"Package import check timed out after {timeout_duration} seconds"
+        except Exception as e:
+            output = ""
+            error = e
+
+        statuses = {}
+        for line in output.splitlines():
+            status, _, package = line.partition(" ")
+            statuses[package] = status
+        return statuses, error
+
     def test_python_packages(self):
         """Test required Python packages"""
         required_packages = ["psutil", "colorama", "requests", "numpy", "pandas"]
 
         try:
             # Activate environment and test packages
+            from ai_uv_manager import UVManager
             uv_manager = UVManager(self.venv_path)
             uv_manager.setup_venv_paths()
             
+            # Special handling for packages that can be slow to import
+            for package in required_packages:
+                if package in _IMPORT_TIMEOUTS:
+                    self.print_info(f"  Testing {package} (may take a moment)...")
+
+            to_probe = required_packages
+            statuses, error = {}, None
+            if self._running_in_venv():
+                statuses, to_probe = self._import_statuses_in_process(required_packages)
+            if to_probe:
+                probed, error = self._import_statuses_subprocess(to_probe)
+                statuses.update(probed)
+
             package_results = []
             for package in required_packages:
-                try:
-                    # Special handling for packages that can be slow to import
-                    if package == "pandas":
-                        timeout_duration = 15
-                        self.print_info(f"  Testing {package} (may take a moment)...")
-                    elif package == "numpy":
-                        timeout_duration = 10
-                        self.print_info(f"  Testing {package} (may take a moment)...")
-                    else:
-                        timeout_duration = 5
-                    
-                    result = subprocess.run(["python", "-c", f"import {package}; print('{package} OK')"], 
-                                          capture_output=True, text=True, timeout=timeout_duration)
-                    if result.returncode == 0:
-                        self.print_success(f"  ✓ {package} package available")
-                        package_results.append(True)
-                    else:
-                        self.print_error(f"  ✗ {package} package missing or broken")
-                        package_results.append(False)
-                except subprocess.TimeoutExpired:
-                    self.print_error(f"  ✗ {package} test error: Command 'python -c import {package}' timed out after {timeout_duration} seconds")
+                status = statuses.get(package)
+                if status == "OK":
+                    self.print_success(f"  ✓ {package} package available")
+                    package_results.append(True)
+                elif status == "FAIL":
+                    self.print_error(f"  ✗ {package} package missing or broken")
                     package_results.append(False)
-                except Exception as e:
-                    self.print_error(f"  ✗ {package} test error: {e}")
+                else:
+                    self.print_error(f"  ✗ {package} test error: {error or 'import check did not complete'}")
                     package_results.append(False)
             
             if all(package_results):
@@ -208,13 +377,13 @@ class ComponentTester:
 
         # 1. Check portable location
         portable_ollama = self.ai_env_path / "Ollama" / "ollama.exe"
-        if portable_ollama.exists():
+        if self._exists(portable_ollama):
             self.print_success("Ollama directory found (portable)")
             ollama_exe = portable_ollama
 
         # 2. Check AI_Environment subfolder
         installer_ollama = self.ai_env_path / "AI_Environment" / "Ollama" / "ollama.exe"
-        if not ollama_exe and installer_ollama.exists():
+        if not ollama_exe and self._exists(installer_ollama):
             self.print_success("Ollama directory found (in AI_Environment subfolder)")
             ollama_exe = installer_ollama
 
@@ -224,7 +393,7 @@ class ComponentTester:
             try:
                 # Try version command first
                 result = subprocess.run([str(ollama_exe), "version"],
-                                      capture_output=True, text=True, timeout=10)
+                                      capture_output=True, text=True, timeout=10, close_fds=False)
                 if result.returncode == 0:
                     version_info = result.stdout.strip()
                     self.print_success(f"  ✓ Ollama version: {version_info}")
@@ -234,7 +403,7 @@ class ComponentTester:
                     # Try alternative commands if version fails
                     self.print_info("  - Version command failed, trying alternative check...")
                     result2 = subprocess.run([str(ollama_exe), "--help"],
-                                            capture_output=True, text=True, timeout=5)
+                                            capture_output=True, text=True, timeout=5, close_fds=False)
                     if result2.returncode == 0:
                         self.print_success("  ✓ Ollama executable responds to --help")
                         self.print_success("Ollama installation test PASSED (basic)")
@@ -271,6 +440,7 @@ class ComponentTester:
                 self.print_info("  ℹ No active virtual environment")
             
             # Test basic Windows commands
+            from ai_path_manager import PathManager
             path_manager = PathManager()
             cmd_results = path_manager.test_basic_commands()
             
@@ -297,9 +467,7 @@ class ComponentTester:
             
             # Test model manager import
             try:
-                import sys
-                sys.path.append(str(self.ai_env_path / "src"))
-                from ai_model_manager import AIModelManager
+                self._import_from_src("ai_model_manager", "AIModelManager")
                 self.print_success("  ✓ AI Model Manager module loads correctly")
             except ImportError as e:
                 self.print_error(f"  ✗ AI Model Manager import failed: {e}")
@@ -307,7 +475,7 @@ class ComponentTester:
             
             # Test model loader import
             try:
-                from ai_model_loader import ModelLoader
+                self._import_from_src("ai_model_loader", "ModelLoader")
                 self.print_success("  ✓ Model Loader module loads correctly")
             except ImportError as e:
                 self.print_error(f"  ✗ Model Loader import failed: {e}")
@@ -315,7 +483,7 @@ class ComponentTester:
             
             # Test model downloader import
             try:
-                from ai_model_downloader import ModelDownloader
+                self._import_from_src("ai_model_downloader", "ModelDownloader")
                 self.print_success("  ✓ Model Downloader module loads correctly")
             except ImportError as e:
                 self.print_error(f"  ✗ Model Downloader import failed: {e}")
@@ -323,12 +491,14 @@ class ComponentTester:
             
             # Test help directory
             help_dir = self.ai_env_path / "help"
-            if help_dir.exists():
-                help_files = list(help_dir.glob("*.txt"))
-                if len(help_files) >= 5:
-                    self.print_success(f"  ✓ Help directory contains {len(help_files)} model help files")
+            if self._is_dir(help_dir):
+                # Count names straight from scandir; no Path object per file
+                with os.scandir(help_dir) as entries:
+                    help_count = sum(1 for entry in entries if entry.name.endswith(".txt"))
+                if help_count >= 5:
+                    self.print_success(f"  ✓ Help directory contains {help_count} model help files")
                 else:
-                    self.print_info(f"  ⚠ Help directory contains only {len(help_files)} files (expected 5+)")
+                    self.print_info(f"  ⚠ Help directory contains only {help_count} files (expected 5+)")
             else:
                 self.print_error("  ✗ Help directory not found")
                 return False
@@ -347,9 +517,7 @@ class ComponentTester:
             
             # Test Jupyter manager import
             try:
-                import sys
-                sys.path.append(str(self.ai_env_path / "src"))
-                from ai_jupyter_manager import JupyterLabManager
+                self._import_from_src("ai_jupyter_manager", "JupyterLabManager")
                 self.print_success("  ✓ Jupyter Lab Manager module loads correctly")
             except ImportError as e:
                 self.print_error(f"  ✗ Jupyter Lab Manager import failed: {e}")
@@ -357,10 +525,12 @@ class ComponentTester:
             
             # Test Projects directory
             projects_dir = self.ai_env_path / "Projects"
-            if projects_dir.exists():
-                project_dirs = [d for d in projects_dir.iterdir() if d.is_dir()]
-                if len(project_dirs) > 0:
-                    self.print_success(f"  ✓ Projects directory contains {len(project_dirs)} project(s)")
+            if self._is_dir(projects_dir):
+                # scandir entries know their type, so no stat() per project
+                with os.scandir(projects_dir) as entries:
+                    project_count = sum(1 for entry in entries if entry.is_dir())
+                if project_count > 0:
+                    self.print_success(f"  ✓ Projects directory contains {project_count} project(s)")
                 else:
                     self.print_info("  ℹ Projects directory is empty (normal for new installation)")
             else:
@@ -376,101 +546,90 @@ class ComponentTester:
     def test_safe_update_mechanism(self):
         """Test the safe update mechanism for run_ai_env.bat"""
         self.print_info("Testing safe update mechanism...")
-        
-        new_bat_file = self.ai_env_path / "run_ai_env.bat.new"
-        temp_update_script = self.ai_env_path / "temp_update_script.bat"
 
-        # Simulate creation of the .new file and the temp script
-        try:
-            with open(new_bat_file, "w") as f:
-                f.write("echo This is the new run_ai_env.bat")
-            self.print_success(f"  ✓ Created dummy {new_bat_file.name}")
-
-            script_content = f"""
-@echo off
-REM This is a dummy update script
-DEL "{new_bat_file}"
-DEL "%~f0"
-"""
-            with open(temp_update_script, "w") as f:
-                f.write(script_content)
-            self.print_success(f"  ✓ Created dummy {temp_update_script.name}")
-
-            # Check if the files exist
-            if new_bat_file.exists() and temp_update_script.exists():
-                self.print_success("  ✓ Staging files for safe update exist")
-                self.print_success("Safe update mechanism test PASSED")
-                return True
-            else:
-                self.print_error("  ✗ Staging files for safe update do not exist")
-                self.print_error("Safe update mechanism test FAILED")
-                return False
-        except Exception as e:
-            self.print_error(f"  ✗ Error during safe update mechanism test: {e}")
+        # The update stages run_ai_env.bat.new and a temp update script next to
+        # the launcher; being allowed to create them there is what matters
+        if os.access(self.ai_env_path, os.W_OK):
+            self.print_success("  ✓ Update staging files can be created in the AI Environment directory")
+            self.print_success("Safe update mechanism test PASSED")
+            return True
+        else:
+            self.print_error("  ✗ AI Environment directory is not writable; update staging files cannot be created")
             self.print_error("Safe update mechanism test FAILED")
             return False
-        finally:
-            # Clean up dummy files
-            if new_bat_file.exists():
-                new_bat_file.unlink()
-            if temp_update_script.exists():
-                temp_update_script.unlink()
+
+    def _run_steps_concurrently(self, executor, stdout, steps, start, stop, results):
+        """Run steps[start:stop] together, printing each one's output in step order"""
+        futures = [executor.submit(stdout.run_captured, test) for _, _, test in steps[start:stop]]
+        for step_num, (key, description, _), future in zip(range(start + 1, stop + 1), steps[start:stop], futures):
+            self.print_step(step_num, description)
+            results[key], output = future.result()
+            stdout.write(output)
 
     def run_all_tests(self):
         """Run all component tests"""
+        steps = (
+            ("directory_structure", "Testing AI Environment directory structure", self.test_directory_structure),
+            ("uv_installation", "Testing UV installation", self.test_uv_installation),
+            ("venv_environment", "Testing UV virtual environment", self.test_venv_environment),
+            ("python_packages", "Testing Python packages", self.test_python_packages),
+            ("ollama_installation", "Testing Ollama installation (optional)", self.test_ollama_installation),
+            ("system_integration", "Testing system integration", self.test_system_integration),
+            ("model_management", "Testing AI model management system", self.test_model_management_system),
+            ("jupyter_lab_management", "Testing Jupyter Lab management system", self.test_jupyter_lab_system),
+            ("safe_update_mechanism", "Testing safe update mechanism", self.test_safe_update_mechanism),
+        )
+        # The package test rewrites PATH/VIRTUAL_ENV/PYTHONHOME, so it runs alone:
+        # steps before it see the original environment, steps after it the venv's
+        env_step = 3
         results = {}
-        
-        self.print_step(1, "Testing AI Environment directory structure")
-        results["directory_structure"] = self.test_directory_structure()
 
-        self.print_step(2, "Testing UV installation")
-        results["uv_installation"] = self.test_uv_installation()
-
-        self.print_step(3, "Testing UV virtual environment")
-        results["venv_environment"] = self.test_venv_environment()
-        
-        self.print_step(4, "Testing Python packages")
-        results["python_packages"] = self.test_python_packages()
-        
-        self.print_step(5, "Testing Ollama installation (optional)")
-        results["ollama_installation"] = self.test_ollama_installation()
-        
-        self.print_step(6, "Testing system integration")
-        results["system_integration"] = self.test_system_integration()
+        # The other tests mostly wait on subprocesses and the filesystem, so each
+        # group runs at once; output is held back and printed in step order
+        stdout = _ThreadedStdout(sys.stdout)
+        sys.stdout = stdout
+        executor = ThreadPoolExecutor(max_workers=len(steps) - env_step - 1)
+        try:
+            self._run_steps_concurrently(executor, stdout, steps, 0, env_step, results)
 
-        self.print_step(7, "Testing AI model management system")
-        results["model_management"] = self.test_model_management_system()
+            key, description, test = steps[env_step]
+            self.print_step(env_step + 1, description)
+            results[key] = test()
 
-        self.print_step(8, "Testing Jupyter Lab management system")
-        results["jupyter_lab_management"] = self.test_jupyter_lab_system()
+            self._run_steps_concurrently(executor, stdout, steps, env_step + 1, len(steps), results)
+        finally:
+            sys.stdout = stdout.stream
+            # On Ctrl-C, don't sit waiting for tests that haven't started yet
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        self.print_step(9, "Testing safe update mechanism")
-        results["safe_update_mechanism"] = self.test_safe_update_mechanism()
-        
         self.print_summary(results)
         return all(results.values())
         
     def print_summary(self, results):
         """Print test summary"""
-        print("\n============================================================")
-        print("                        TEST SUMMARY")
-        print("============================================================")
-        
         total_tests = len(results)
         passed_tests = sum(1 for r in results.values() if r)
         failed_tests = total_tests - passed_tests
         success_rate = (passed_tests / total_tests) * 100 if total_tests > 0 else 0
-        
-        print(f"Total tests run: {total_tests}")
-        print(f"Tests passed: {passed_tests}")
-        print(f"Tests failed: {failed_tests}")
-        print(f"Success rate: {success_rate:.1f}%")
-        print()
-        
+
         if passed_tests == total_tests:
-            print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! Your AI Environment is fully functional.{Style.RESET_ALL}")
+            verdict = f"{Fore.GREEN}🎉 ALL TESTS PASSED! Your AI Environment is fully functional.{Style.RESET_ALL}\n"
         else:
-            print(f"{Fore.RED}❌ SOME TESTS FAILED. Please review the errors above.{Style.RESET_ALL}")
+            verdict = f"{Fore.RED}❌ SOME TESTS FAILED. Please review the errors above.{Style.RESET_ALL}\n"
+
+        # Hand the whole block to stdout at once
+        sys.stdout.writelines((
+            "\n============================================================\n",
+            "                        TEST SUMMARY\n",
+            "============================================================\n",
+            f"Total tests run: {total_tests}\n",
+            f"Tests passed: {passed_tests}\n",
+            f"Tests failed: {failed_tests}\n",
+            f"Success rate: {success_rate:.1f}%\n",
+            "\n",
+            verdict,
+        ))
+        sys.stdout.flush()
 
 def main():
     """Main function for standalone execution"""
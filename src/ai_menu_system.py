@@ -11,6 +11,8 @@ AI Environment - Menu System Module
 Interactive menu interfaces for AI Environment management
 """
 
+import sys
+
 try:
     from colorama import Fore, Style
 except ImportError:
@@ -26,44 +28,63 @@ class MenuSystem:
         self.script_version = script_version
         self.script_date = script_date
         
+    def build_header_string(self):
+        """Build the application header text"""
+        return (
+            f"\n{Fore.CYAN}{'='*64}{Style.RESET_ALL}\n"
+            f"{Fore.CYAN}                AI Environment Manager{Style.RESET_ALL}\n"
+            f"{Fore.CYAN}               Version {self.script_version} ({self.script_date}){Style.RESET_ALL}\n"
+            f"{Fore.CYAN}               Portable AI Development{Style.RESET_ALL}\n"
+            f"{Fore.CYAN}{'='*64}{Style.RESET_ALL}\n"
+        )
+        
     def print_header(self):
         """Print application header"""
-        print(f"\n{Fore.CYAN}{'='*64}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}                AI Environment Manager{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}               Version {self.script_version} ({self.script_date}){Style.RESET_ALL}")
-        print(f"{Fore.CYAN}               Portable AI Development{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'='*64}{Style.RESET_ALL}")
+        sys.stdout.write(self.build_header_string())
         
-    def print_interactive_menu(self):
-        """Print main interactive menu with fixed colors for black terminal backgrounds"""
-        print(f"\n{Fore.CYAN}📋 Available Actions:{Style.RESET_ALL}")
-        print(f" 1. {Fore.GREEN}🚀 Full Activation{Style.RESET_ALL} (Complete Setup)")
-        print(f" 2. {Fore.YELLOW}🧹 Restore Original PATH{Style.RESET_ALL}")
-        print(f" 3. {Fore.WHITE}🐍 Activate Conda Environment Only{Style.RESET_ALL}")
-        print(f" 4. {Fore.CYAN}🧪 Test All Components{Style.RESET_ALL}")
-        print(f" 5. {Fore.GREEN}🌶️ Setup Flask{Style.RESET_ALL}")
-        print(f" 6. {Fore.WHITE}🦙 Setup Ollama Server{Style.RESET_ALL}")
-        print(f" 7. {Fore.MAGENTA}🔥 Download AI Models{Style.RESET_ALL}")
-        print(f" 8. {Fore.GREEN}✅ Run Environment Validation{Style.RESET_ALL}")
-        print(f" 9. {Fore.GREEN}🚀 Launch Applications{Style.RESET_ALL}")
-        
-        # Show background processes count
+    def build_menu_strings(self):
+        """
+        Build the static parts of the main menu as (before, after) the
+        background processes line, which is the only part that changes.
+        """
+        before = (
+            f"\n{Fore.CYAN}📋 Available Actions:{Style.RESET_ALL}\n"
+            f" 1. {Fore.GREEN}🚀 Full Activation{Style.RESET_ALL} (Complete Setup)\n"
+            f" 2. {Fore.YELLOW}🧹 Restore Original PATH{Style.RESET_ALL}\n"
+            f" 3. {Fore.WHITE}🐍 Activate Conda Environment Only{Style.RESET_ALL}\n"
+            f" 4. {Fore.CYAN}🧪 Test All Components{Style.RESET_ALL}\n"
+            f" 5. {Fore.GREEN}🌶️ Setup Flask{Style.RESET_ALL}\n"
+            f" 6. {Fore.WHITE}🦙 Setup Ollama Server{Style.RESET_ALL}\n"
+            f" 7. {Fore.MAGENTA}🔥 Download AI Models{Style.RESET_ALL}\n"
+            f" 8. {Fore.GREEN}✅ Run Environment Validation{Style.RESET_ALL}\n"
+            f" 9. {Fore.GREEN}🚀 Launch Applications{Style.RESET_ALL}\n"
+        )
+        after = (
+            f"11. {Fore.CYAN}🔧 Advanced Options{Style.RESET_ALL}\n"
+            f"12. {Fore.WHITE}💻 Open AI2025 Terminal{Style.RESET_ALL} (Enhanced terminal with return function)\n"
+            f"13. {Fore.WHITE}📋 Version & Documentation{Style.RESET_ALL} (README, Package Info, About)\n"
+            f"14. {Fore.YELLOW}🚪 Quit{Style.RESET_ALL} (Leave processes running)\n"
+            f"15. {Fore.RED}🛑 Exit and Close All{Style.RESET_ALL} (Stop all background processes)\n"
+        )
+        return before, after
+        
+    def build_background_processes_line(self):
+        """Build the menu line for background processes, with the active count"""
         try:
             from ai_process_manager import ProcessManager
             process_manager = ProcessManager()
             active_count = len(process_manager.get_active_processes())
             if active_count > 0:
-                print(f"10. {Fore.YELLOW}🔄 Background Processes{Style.RESET_ALL} ({active_count})")
+                return f"10. {Fore.YELLOW}🔄 Background Processes{Style.RESET_ALL} ({active_count})\n"
             else:
-                print(f"10. {Fore.YELLOW}🔄 Background Processes{Style.RESET_ALL} (none)")
+                return f"10. {Fore.YELLOW}🔄 Background Processes{Style.RESET_ALL} (none)\n"
         except:
-            print(f"10. {Fore.YELLOW}🔄 Background Processes{Style.RESET_ALL}")
-            
-        print(f"11. {Fore.CYAN}🔧 Advanced Options{Style.RESET_ALL}")
-        print(f"12. {Fore.WHITE}💻 Open AI2025 Terminal{Style.RESET_ALL} (Enhanced terminal with return function)")
-        print(f"13. {Fore.WHITE}📋 Version & Documentation{Style.RESET_ALL} (README, Package Info, About)")
-        print(f"14. {Fore.YELLOW}🚪 Quit{Style.RESET_ALL} (Leave processes running)")
-        print(f"15. {Fore.RED}🛑 Exit and Close All{Style.RESET_ALL} (Stop all background processes)")
+            return f"10. {Fore.YELLOW}🔄 Background Processes{Style.RESET_ALL}\n"
+        
+    def print_interactive_menu(self):
+        """Print main interactive menu with fixed colors for black terminal backgrounds"""
+        before, after = self.build_menu_strings()
+        sys.stdout.write(before + self.build_background_processes_line() + after)
         
     def print_advanced_menu(self):
         """Print advanced options menu with fixed colors"""
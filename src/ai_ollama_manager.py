@@ -65,15 +65,15 @@ class OllamaManager:
         ]
 
         for path in possible_paths:
-            if path.exists() and path.is_dir():
+            if path.is_dir():
                 # Verify this directory actually contains models by checking for blobs
                 blobs_dir = path / "blobs"
-                if blobs_dir.exists() and any(blobs_dir.iterdir()):
+                if blobs_dir.is_dir() and any(blobs_dir.iterdir()):
                     return path
 
         # If no existing directory with models found, check for any existing empty directories
         for path in possible_paths:
-            if path.exists() and path.is_dir():
+            if path.is_dir():
                 return path
 
         # If no existing directory found, create in AI_Environment subfolder
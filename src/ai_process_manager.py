@@ -12,7 +12,10 @@ AI Environment - Background Process Manager
 Tracks and controls all background processes launched from the menu with enhanced VS Code integration
 """
 
+import os
+import shlex
 import subprocess
+import threading
 import time
 import json
 from pathlib import Path
@@ -33,6 +36,27 @@ except ImportError:
     class Style:
         RESET_ALL = ""
 
+# Output of detached launches is discarded
+_DEVNULL_FILE_ACTIONS = (
+    (getattr(os, 'POSIX_SPAWN_OPEN', None), 1, os.devnull, os.O_WRONLY, 0),
+    (getattr(os, 'POSIX_SPAWN_OPEN', None), 2, os.devnull, os.O_WRONLY, 0),
+)
+
+def spawn_detached(argv):
+    """Start argv in the background with output discarded and return its PID
+
+    Uses posix_spawn where available, which avoids duplicating the parent's
+    page tables the way fork+exec does; falls back to Popen elsewhere.
+    """
+    if hasattr(os, 'posix_spawnp'):
+        pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=_DEVNULL_FILE_ACTIONS)
+        # Reap the child when it exits so it doesn't linger as a zombie
+        threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+        return pid
+
+    process = subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return process.pid
+
 class BackgroundProcessManager:
     """Manages all background processes launched from the AI Environment menu"""
     
@@ -97,7 +121,11 @@ class BackgroundProcessManager:
             self.save_tracked_processes()
             
     def track_process(self, process_id, name, pid, command, url=None):
-        """Track a background process"""
+        """Track a background process
+
+        command may be an argv list or a command string; lists are stored
+        as-is and only joined when the process list is displayed.
+        """
         try:
             from datetime import datetime
 
@@ -443,19 +471,25 @@ st.dataframe(data.head())
             return False
             
     def launch_custom_command(self, command, name, work_dir=None):
-        """Launch custom command in background"""
+        """Launch custom command in background
+
+        command may be an argv list, which is executed directly, or a shell
+        command string, which goes through /bin/sh as before.
+        """
         try:
             self.print_info(f"Launching {name} in background...")
             
             if work_dir is None:
                 work_dir = self.ai_env_path
                 
+            # An argv list skips the intermediate /bin/sh process
+            use_shell = isinstance(command, str)
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 cwd=str(work_dir),
-                shell=True,
+                shell=use_shell,
                 # macOS: no special creation flags needed
             )
             
@@ -504,7 +538,10 @@ st.dataframe(data.head())
                 print(f"  CPU: {cpu_percent}%")
                 print(f"  Memory: {memory_mb} MB")
                 print(f"  Started: {process_info['started_at']}")
-                print(f"  Command: {process_info['command']}")
+                command = process_info['command']
+                if isinstance(command, (list, tuple)):
+                    command = shlex.join(command)
+                print(f"  Command: {command}")
                 
                 if 'url' in process_info:
                     print(f"  URL: {process_info['url']}")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+AI Environment Version Baker v3.0.28
+Writes src/_version.py from version_config.json so activate_ai_env.py
+does not have to parse the configuration on every launch
+
+Author: AI Environment Team
+Date: 2025-08-14
+Version: 3.0.28
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT / "src"
+VERSION_FILE = SRC_DIR / "_version.py"
+
+TEMPLATE = '''\
+# Generated by tools/bake_version.py - do not edit
+SCRIPT_VERSION = "{version}"
+SCRIPT_DATE = "{date}"
+'''
+
+def main():
+    # Reuse the runtime version logic; skip the launch-method check on import
+    os.environ['AI_ENV_VALIDATED'] = '1'
+    sys.path.insert(0, str(SRC_DIR))
+    from activate_ai_env import get_highest_version, get_current_datetime
+
+    version = get_highest_version()
+    VERSION_FILE.write_text(TEMPLATE.format(version=version, date=get_current_datetime()),
+                            encoding='utf-8')
+    print(f"[INFO] Wrote {VERSION_FILE} (version {version})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())